@@ -0,0 +1,104 @@
+INF = float("inf")
+
+
+class BucketQueue:
+    """
+    Monotone bucket priority queue for Dial's algorithm, for shortest paths
+    where every edge weight is a small non-negative integer.
+    Items are kept in one bucket per integer priority and pop() scans upwards
+    from the lowest non-empty bucket, so a whole search costs O(V + W*C)
+    for max edge weight C and no heap comparisons are done.
+    Same interface as PriorityQueue. Priorities must be integers, or inf for
+    items that have not been reached yet. Ties are popped in LIFO order.
+    """
+    def __init__(self):
+        self.buckets = {}  # priority -> dict of the items at that priority
+        self.unreached = {}  # Items with priority inf
+        self.priorities = {}  # item -> priority
+        self.cursor = None  # No non-empty finite bucket is below this
+
+    def add(self, item, priority=INF):
+        """Add a item to the queue (remove/replace if it is already there)"""
+        if item in self.priorities:
+            self.remove_item(item)
+
+        self.priorities[item] = priority
+
+        if priority == INF:
+            self.unreached[item] = None
+            return
+
+        if priority.__class__ is not int and priority != int(priority):
+            raise ValueError(f"BucketQueue priorities must be integers, got {priority}")
+
+        bucket = self.buckets.get(priority)
+        if bucket is None:
+            self.buckets[priority] = {item: None}
+        else:
+            bucket[item] = None
+        if self.cursor is None or priority < self.cursor:
+            self.cursor = priority
+
+    def remove_item(self, item):
+        """Remove an item from the queue"""
+        priority = self.priorities.pop(item)
+
+        if priority == INF:
+            del self.unreached[item]
+            return
+
+        bucket = self.buckets[priority]
+        del bucket[item]
+        if not bucket:
+            del self.buckets[priority]
+
+    def pop(self):
+        """
+        Remove an item with the lowest priority,
+        returns tuple of (item, priority)
+        """
+        if self.buckets:
+            # Skip ahead over empty buckets; in Dial's algorithm the cursor
+            # never moves backwards, so this scan is bounded by the max distance
+            while self.cursor not in self.buckets:
+                self.cursor += 1
+
+            bucket = self.buckets[self.cursor]
+            item, _ = bucket.popitem()
+            if not bucket:
+                del self.buckets[self.cursor]
+        elif self.unreached:
+            item, _ = self.unreached.popitem()
+        else:
+            raise KeyError("Can not pop when queue is empty")
+
+        return (item, self.priorities.pop(item))
+
+    def update(self, item, priority):
+        """
+        If specified priority is _higher_ than the item's current priority, no
+            changes are made.
+        If item exists in the queue and the specified priority is _lower_ than
+            its current priority, move the item to the lower priority's bucket.
+        If item is not in queue, add it with the specified priority.
+        """
+        current = self.priorities.get(item)
+        if current is None or priority < current:
+            self.add(item, priority)
+
+    def contains(self, item):
+        return item in self.priorities
+
+    def __getitem__(self, item):
+        """Return the priority of item"""
+        return self.priorities[item]
+
+    def __setitem__(self, item, priority):
+        """Update the item priority only if it already exists"""
+        if item in self.priorities:
+            self.add(item, priority=priority)
+        else:
+            raise KeyError(item)
+
+    def __len__(self):
+        return len(self.priorities)
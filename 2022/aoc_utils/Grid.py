@@ -0,0 +1,113 @@
+import numpy as np
+from typing import List, Tuple
+
+
+class Grid:
+    """
+    2D puzzle grid backed by a contiguous NumPy array.
+    Neighbors are read as whole shifted views of a padded copy of the array,
+    so per-cell work is done by NumPy rather than Python loops over tuples.
+    Text grids are stored as uint8 character codes, digit grids as int8.
+    """
+    OFFSETS_4 = [(-1, 0), (0, -1), (0, 1), (1, 0)]
+    OFFSETS_8 = [(-1, -1), (-1, 0), (-1, 1),
+                 (0, -1), (0, 1),
+                 (1, -1), (1, 0), (1, 1)]
+
+    def __init__(self, array, text: bool = False) -> None:
+        self.array = np.ascontiguousarray(array)
+        self.text = text  # When True, values are character codes
+
+    @classmethod
+    def from_bytes(cls, data: bytes, digits: bool = False):
+        """
+        Parse raw puzzle input with one row per line straight into an array
+        with np.frombuffer. digits=True converts '0'-'9' to their int values.
+        """
+        data = data.replace(b"\r\n", b"\n").strip(b"\n")
+        width = data.find(b"\n")
+        if width < 0:
+            width = len(data)
+
+        codes = np.frombuffer(data + b"\n", dtype=np.uint8)
+        # Checking the total length alone misses ragged rows that happen to
+        # add up, so every newline must also end a full row
+        newlines = np.flatnonzero(codes == ord("\n"))
+        if codes.size % (width + 1) or (newlines % (width + 1) != width).any():
+            raise ValueError("Every row of the grid must be the same length")
+        # Drop the newline column; the view is copied into a contiguous array
+        codes = codes.reshape(-1, width + 1)[:, :width]
+
+        if digits:
+            return cls((codes - ord("0")).astype(np.int8))
+
+        return cls(codes, text=True)
+
+    @classmethod
+    def from_lines(cls, lines: List[str], digits: bool = False):
+        """Build a grid from a list of row strings (or lists of characters)"""
+        return cls.from_bytes("\n".join("".join(line) for line in lines).encode(), digits)
+
+    @classmethod
+    def from_file(cls, path: str, digits: bool = False):
+        """Read a grid from the file at path"""
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read(), digits)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.array.shape
+
+    def __getitem__(self, key):
+        return self.array[key]
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Grid) and np.array_equal(self.array, other.array)
+
+    def __str__(self) -> str:
+        if self.text:
+            return "\n".join(row.tobytes().decode() for row in self.array)
+
+        return "\n".join("".join(str(v) for v in row) for row in self.array.tolist())
+
+    def padded(self, fill=0, width: int = 1) -> np.ndarray:
+        """Returns a copy of the array with a border of fill values around it"""
+        return np.pad(self.array, width, constant_values=fill)
+
+    def neighbor_views(self, connectivity: int = 4, fill=0) -> List[np.ndarray]:
+        """
+        Returns one array per neighbor direction (OFFSETS_4 or OFFSETS_8 order)
+        where view[r, c] is the neighbor of (r, c) in that direction, or fill
+        past the edge of the grid. All views share a single padded copy.
+        """
+        offsets = self.OFFSETS_8 if connectivity == 8 else self.OFFSETS_4
+        padded = self.padded(fill)
+        height, width = self.shape
+
+        return [padded[1 + dr:1 + dr + height, 1 + dc:1 + dc + width] for dr, dc in offsets]
+
+    def shifted(self, dr: int, dc: int, fill=0) -> np.ndarray:
+        """Returns the view of the (dr, dc) neighbor of every cell, see neighbor_views()"""
+        padded = self.padded(fill)
+        height, width = self.shape
+
+        return padded[1 + dr:1 + dr + height, 1 + dc:1 + dc + width]
+
+    def neighbor_sum(self, connectivity: int = 8) -> np.ndarray:
+        """
+        Sums the neighbors of every cell, eg the number of live neighbors
+        when the grid holds bools
+        """
+        views = self.neighbor_views(connectivity, fill=0)
+        total = np.zeros(self.shape, dtype=np.int64)
+        for view in views:
+            total += view
+
+        return total
+
+    def to_list(self) -> List[List]:
+        """Convert back to a list of lists (of characters for text grids)"""
+        if self.text:
+            return [list(row.tobytes().decode()) for row in self.array]
+
+        return self.array.tolist()
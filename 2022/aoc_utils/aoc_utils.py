@@ -1,22 +1,100 @@
+import math
+import mmap
+import numbers
 import os
-from typing import Callable
+from typing import Callable, Iterator
 
+from .BucketQueue import BucketQueue
+from .IndexedPriorityQueue import IndexedPriorityQueue
+from .InputCache import InputCache
 
-def parse_input_file(filename: str,
-                     parse_line: Callable = lambda line: line.strip(),
-                     inputs_path: str = None) -> list:
+# Largest max edge weight for which get_priority_queue() picks a BucketQueue
+BUCKET_QUEUE_MAX_WEIGHT = 100
+
+
+def get_input_path(filename: str, inputs_path: str = None) -> str:
     """
-    Read the given input file into a list, applying the optional
-    parse_fn
+    Resolve the full path to the given input file, falling back to the
+    AOC_INPUTS_PATH environment variable when inputs_path is not given
     """
     inputs_path = inputs_path or os.environ.get("AOC_INPUTS_PATH", None)
     if not inputs_path:
         raise EnvironmentError("AOC_INPUTS_PATH not set in os.environ,"
                                "and inputs_path was not explicitly specified")
-    output = []
 
-    with open(f"{inputs_path}/{filename}") as f:
-        for line in f.readlines():
-            output.append(parse_line(line))
+    return f"{inputs_path}/{filename}"
+
+
+def iter_input_file(filename: str,
+                    parse_line: Callable = lambda line: line.strip(),
+                    inputs_path: str = None) -> Iterator:
+    """
+    Lazily read the given input file one line at a time, yielding the
+    result of the optional parse_line for each line. Only the current
+    line is held in memory.
+    """
+    with open(get_input_path(filename, inputs_path)) as f:
+        for line in f:
+            yield parse_line(line)
+
+
+def iter_input_file_mmap(filename: str,
+                         parse_line: Callable = lambda line: line.strip(),
+                         inputs_path: str = None) -> Iterator:
+    """
+    Same as iter_input_file(), but memory-maps the input file so pages are
+    loaded (and released) by the OS on demand. Lines are decoded as UTF-8
+    with universal newlines like text mode open(): "\r\n" and a lone "\r"
+    both end a line and are translated to "\n".
+    """
+    with open(get_input_path(filename, inputs_path), "rb") as f:
+        # mmap refuses to map an empty file
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line in iter(mm.readline, b""):
+                if b"\r" in line:
+                    # readline() only splits on "\n", so split off any lines
+                    # ended by a lone "\r" here
+                    *lines, line = line.replace(b"\r\n", b"\n").split(b"\r")
+                    for part in lines:
+                        yield parse_line(part.decode() + "\n")
+                    if not line:
+                        continue
+                yield parse_line(line.decode())
+
+
+def parse_input_file(filename: str,
+                     parse_line: Callable = lambda line: line.strip(),
+                     inputs_path: str = None) -> list:
+    """
+    Read the given input file into a list, applying the optional
+    parse_fn. When AOC_CACHE_PATH is set in os.environ the parsed list is
+    cached on disk there, so unchanged inputs are only parsed once.
+    """
+    cache_path = os.environ.get("AOC_CACHE_PATH", None)
+    if not cache_path:
+        return list(iter_input_file(filename, parse_line, inputs_path))
+
+    path = get_input_path(filename, inputs_path)
+    cache = InputCache(cache_path)
+
+    return cache.fetch(path, parse_line,
+                       lambda: list(iter_input_file(filename, parse_line, inputs_path)))
+
+
+def get_priority_queue(max_edge_weight: int = None):
+    """
+    Pick the fastest priority queue for a shortest path search: a BucketQueue
+    (Dial's algorithm) when every edge weight is a known small integer,
+    otherwise an IndexedPriorityQueue
+    """
+    # int() can't convert inf or nan, so rule out non-finite weights first
+    if (isinstance(max_edge_weight, numbers.Real)
+            and math.isfinite(max_edge_weight)
+            and max_edge_weight == int(max_edge_weight)
+            and 0 <= max_edge_weight <= BUCKET_QUEUE_MAX_WEIGHT):
+        return BucketQueue()
 
-    return output
+    return IndexedPriorityQueue()
@@ -1,3 +1,8 @@
+import heapq
+import io
+from typing import Iterable, Iterator, List, Union
+
+
 def split_groups(list_str):
     group_strings = list_str.split("\n\n")
     groups = [group_str.split() for group_str in group_strings]
@@ -13,6 +18,48 @@ def sum_groups(group_list):
 
 
 def sum_top_k(nums, k):
-    k_sum = sum(sorted(nums)[-k:])
+    k_sum = sum(heapq.nlargest(k, nums))
 
     return k_sum
+
+
+def iter_group_sums(lines: Union[str, Iterable[str]]) -> Iterator[int]:
+    """
+    Yields the sum of each blank-line separated group as soon as the group
+    ends, without keeping the group itself. lines can be a string or any
+    iterable of lines, eg an open file.
+    """
+    if isinstance(lines, str):
+        lines = io.StringIO(lines)
+
+    group_sum = None
+
+    for line in lines:
+        line = line.strip()
+        if line:
+            group_sum = (group_sum or 0) + int(line)
+        elif group_sum is not None:
+            yield group_sum
+            group_sum = None
+
+    if group_sum is not None:
+        yield group_sum
+
+
+def stream_top_k(lines: Union[str, Iterable[str]], k: int) -> List[int]:
+    """
+    Returns the k largest group sums (largest first) in a single pass,
+    keeping only a k-item min-heap: O(k) memory and O(n log k) time
+    """
+    if k <= 0:
+        return []
+
+    top_k = []
+
+    for group_sum in iter_group_sums(lines):
+        if len(top_k) < k:
+            heapq.heappush(top_k, group_sum)
+        elif group_sum > top_k[0]:
+            heapq.heapreplace(top_k, group_sum)
+
+    return sorted(top_k, reverse=True)
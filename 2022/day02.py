@@ -1,5 +1,7 @@
 from typing import List, Tuple
 
+import numpy as np
+
 
 """
 Part 1 Shapes:
@@ -22,11 +24,8 @@ GAME_SCORES = {
 
 
 def read_file(filename: str) -> List[Tuple]:
-    rounds = []
     with open(filename) as f:
-        for line in f.readlines():
-            round = tuple(line.strip().split(' '))
-            rounds.append(round)
+        rounds = [tuple(line.split()) for line in f]
 
     return rounds
 
@@ -46,6 +45,81 @@ def score_rounds(rounds: List[Tuple[str, str]],
     return score
 
 
+def count_round_lines(data: bytes) -> np.ndarray:
+    """
+    Counts each of the 9 possible rounds one line at a time, for strategy
+    guides count_round_types() can't view as fixed width records.
+    Blank lines are skipped; any other line must be a valid round.
+    """
+    counts = np.zeros((3, 3), dtype=np.int64)
+
+    for line in data.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+
+        opponent, response = line[0] - ord('A'), line[-1] - ord('X')
+        if len(line) != 3 or line[1] != ord(' ') or not (0 <= opponent < 3 and 0 <= response < 3):
+            raise ValueError(f"Strategy guide contains an invalid round: {line!r}")
+        counts[opponent, response] += 1
+
+    return counts
+
+
+def count_round_types(data: bytes) -> np.ndarray:
+    """
+    Counts how many times each of the 9 possible rounds appears in a raw
+    strategy guide, without creating a Python object per round.
+    Returns a 3x3 array indexed by [opponent (A-C), response (X-Z)].
+    When every line has the same length ("A X\n" or "A X\r\n") the buffer
+    is viewed as fixed width records in NumPy, otherwise the rounds are
+    counted line by line. Raises ValueError for an invalid round.
+    """
+    width = data.find(b"\n") + 1
+    num_records = len(data) // width if width >= 4 else 0
+    records = np.frombuffer(data, dtype=np.uint8, count=num_records * width)
+    records = records.reshape(num_records, width)
+
+    # Fall back for odd layouts, eg blank lines or a mix of line endings
+    if (width not in (4, 5)
+            or not (records[:, 1] == ord(' ')).all()
+            or not (records[:, -1] == ord('\n')).all()
+            or (width == 5 and not (records[:, 3] == ord('\r')).all())):
+        return count_round_lines(data)
+
+    counts = np.zeros(9, dtype=np.int64)
+    # Work in blocks so the index arrays bincount copies stay small
+    block_size = 1 << 20
+
+    for start in range(0, num_records, block_size):
+        block = records[start:start + block_size]
+        # uint8 arithmetic wraps, so anything outside A-C / X-Z ends up above 2
+        opponents = block[:, 0] - np.uint8(ord('A'))
+        responses = block[:, 2] - np.uint8(ord('X'))
+        if (opponents > 2).any() or (responses > 2).any():
+            raise ValueError("Strategy guide contains an invalid round")
+        counts += np.bincount(opponents * np.uint8(3) + responses, minlength=9)
+
+    # A final line without a newline isn't covered by the records
+    counts = counts.reshape(3, 3) + count_round_lines(data[num_records * width:])
+
+    return counts
+
+
+def score_buffer(data: bytes, scores: dict = GAME_SCORES) -> int:
+    """Scores every round in a raw strategy guide at once"""
+    score_table = np.array([[scores[opponent][response] for response in 'XYZ']
+                            for opponent in 'ABC'])
+
+    return int((count_round_types(data) * score_table).sum())
+
+
+def score_file(filename: str, scores: dict = GAME_SCORES) -> int:
+    """Reads the strategy guide as bytes and scores it with score_buffer()"""
+    with open(filename, "rb") as f:
+        return score_buffer(f.read(), scores)
+
+
 """
 Part 2 updates
 A: Rock (1 pt)
@@ -1,24 +1,58 @@
-from typing import List
+from functools import reduce
+from operator import and_, or_
+from typing import List, Tuple, Union
 
 PRIORITY = ".abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
 
+# Bit mask for each item, indexed by character code: the item with priority
+# p is bit p, so a set of items is a single int and bit_length() - 1 of a
+# single-item mask is its priority
+ITEM_BITS = [0] * 128
+for priority, item in enumerate(PRIORITY[1:], start=1):
+    ITEM_BITS[ord(item)] = 1 << priority
 
-def calculate_rucksack_priority(items: str) -> int:
+
+def items_mask(items: Union[str, bytes]) -> int:
+    """OR together the bits of every item to get the set of item types"""
+    if isinstance(items, str):
+        items = items.encode()
+
+    return reduce(or_, map(ITEM_BITS.__getitem__, items), 0)
+
+
+def mask_priority(mask: int) -> int:
+    """Sum the priorities of every item in the mask"""
+    priority = 0
+
+    while mask:
+        lowest_bit = mask & -mask
+        priority = priority + lowest_bit.bit_length() - 1
+        mask ^= lowest_bit
+
+    return priority
+
+
+def badge_priority(group_badge: int) -> int:
+    """Priority of the badge in a group's common items mask, which must hold exactly 1 item"""
+    # Exactly one bit set: non-zero, and clearing the lowest bit leaves 0
+    if group_badge == 0 or group_badge & (group_badge - 1):
+        raise ValueError('Rucksacks must contain exactly 1 item in common')
+
+    return group_badge.bit_length() - 1
+
+
+def calculate_rucksack_priority(items: Union[str, bytes]) -> int:
     """
     Identify the item(s) appearing in both compartments and return the
     total priority.
     """
     mid = len(items) // 2
-    shared_items = set(items[:mid]).intersection(set(items[mid:]))
-    priority = 0
-
-    for shared_item in shared_items:
-        priority = priority + PRIORITY.find(shared_item)
+    shared_items = items_mask(items[:mid]) & items_mask(items[mid:])
 
-    return priority
+    return mask_priority(shared_items)
 
 
-def calculate_group_priority(group_rucksacks: List[str]) -> int:
+def calculate_group_priority(group_rucksacks: List[Union[str, bytes]]) -> int:
     """
     Identify the single item appearing in all of the group's rucksacks and
     return its priority
@@ -26,13 +60,39 @@ def calculate_group_priority(group_rucksacks: List[str]) -> int:
     if len(group_rucksacks) != 3:
         raise ValueError('Must pass exactly 3 rucksacks')
 
-    group_badge = set(group_rucksacks[0])\
-        .intersection(set(group_rucksacks[1]))\
-        .intersection(set(group_rucksacks[2]))
+    group_badge = reduce(and_, map(items_mask, group_rucksacks))
 
-    if len(group_badge) != 1:
-        raise ValueError('Rucksacks must contain exactly 1 item in common')
+    return badge_priority(group_badge)
+
+
+def calculate_total_priorities(data: Union[str, bytes]) -> Tuple[int, int]:
+    """
+    Solves both parts in one pass over the whole puzzle input: returns the
+    total of the rucksack priorities and the total of the group priorities.
+    Raises ValueError like calculate_group_priority() if a group lacks a
+    single common item, or if the rucksacks don't split into groups of 3.
+    """
+    if isinstance(data, str):
+        data = data.encode()
+
+    rucksack_total = 0
+    group_total = 0
+    group_badge = 0
+    num_rucksacks = 0
+
+    for i, items in enumerate(data.split()):
+        mid = len(items) // 2
+        left, right = items_mask(items[:mid]), items_mask(items[mid:])
+        rucksack_total += mask_priority(left & right)
+
+        # Start each group with the first rucksack's mask, then AND in the rest
+        mask = left | right
+        group_badge = mask if i % 3 == 0 else group_badge & mask
+        if i % 3 == 2:
+            group_total += badge_priority(group_badge)
+        num_rucksacks = i + 1
 
-    item = group_badge.pop()
+    if num_rucksacks % 3:
+        raise ValueError('Must pass a multiple of 3 rucksacks')
 
-    return PRIORITY.find(item)
+    return rucksack_total, group_total
@@ -1,5 +1,8 @@
+import re
 from typing import Tuple
 
+import numpy as np
+
 # Advent of Code Day 4 solution code
 
 
@@ -26,13 +29,99 @@ def range_overlaps_range(range1: Tuple[int, int],
     start1, end1 = range1
     start2, end2 = range2
 
-    if start1 >= start2 and start1 <= end2:
-        return True
-    elif end1 >= start2 and end1 <= end2:
-        return True
-    elif start2 >= start1 and start2 <= end1:
-        return True
-    elif end2 >= start1 and end2 <= end1:
-        return True
-    else:
-        return False
+    # Ranges overlap unless one ends before the other starts
+    return start1 <= end2 and start2 <= end1
+
+
+def range_pairs_from_text(text: str) -> np.ndarray:
+    """
+    Parses the whole puzzle input (lines of A-B,C-D) into an N x 4 int array
+    with columns start1, end1, start2, end2
+    """
+    return np.array(re.split(r'[-,\s]+', text.strip()), dtype=np.int64).reshape(-1, 4)
+
+
+def ranges_contain_ranges(range_pairs: np.ndarray) -> np.ndarray:
+    """
+    Columnar version of range_contains_range() for an N x 4 array of
+    (start1, end1, start2, end2). Returns an array of N bools.
+    """
+    start1, end1, start2, end2 = np.asarray(range_pairs).T
+
+    return ((start2 >= start1) & (end2 <= end1)) | ((start1 >= start2) & (end1 <= end2))
+
+
+def ranges_overlap_ranges(range_pairs: np.ndarray) -> np.ndarray:
+    """
+    Columnar version of range_overlaps_range() for an N x 4 array of
+    (start1, end1, start2, end2). Returns an array of N bools.
+    """
+    start1, end1, start2, end2 = np.asarray(range_pairs).T
+
+    return (start1 <= end2) & (start2 <= end1)
+
+
+class IntervalIndex:
+    """
+    Index over many inclusive integer ranges (eg every elf's assignment),
+    kept as arrays of endpoints sorted by start and by end. Overlap queries
+    are binary searches instead of pairwise checks against every range.
+    """
+
+    def __init__(self, starts: np.ndarray, ends: np.ndarray) -> None:
+        self.starts = np.asarray(starts, dtype=np.int64)
+        self.ends = np.asarray(ends, dtype=np.int64)
+
+        if np.any(self.starts > self.ends):
+            raise ValueError("Every range must have start <= end")
+
+        self.by_start = np.argsort(self.starts, kind='stable')
+        self.sorted_starts = self.starts[self.by_start]
+        self.sorted_ends = np.sort(self.ends)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def count_overlapping(self, start, end):
+        """
+        Counts the ranges overlapping start-end in O(log n). Every range that
+        does not overlap either starts after end or ends before start.
+        start and end can also be arrays to answer many queries at once.
+        """
+        starts_after = len(self) - np.searchsorted(self.sorted_starts, end, side='right')
+        ends_before = np.searchsorted(self.sorted_ends, start, side='left')
+
+        return len(self) - starts_after - ends_before
+
+    def overlapping(self, start: int, end: int) -> np.ndarray:
+        """Returns the (sorted) indices of every range overlapping start-end"""
+        # Only ranges starting at or before end can overlap
+        candidates = self.by_start[:np.searchsorted(self.sorted_starts, end, side='right')]
+
+        return np.sort(candidates[self.ends[candidates] >= start])
+
+    def count_overlapping_pairs(self) -> int:
+        """Counts every pair of distinct ranges that overlap each other"""
+        # Each range overlaps itself once; every other pair is counted twice
+        total = self.count_overlapping(self.starts, self.ends).sum()
+
+        return int(total - len(self)) // 2
+
+    def covered_length(self) -> int:
+        """
+        Number of sections covered by at least one range, found by sweeping
+        the ranges in start order: each range only adds the sections past
+        the furthest end seen before it
+        """
+        if len(self) == 0:
+            return 0
+
+        starts = self.sorted_starts
+        ends = self.ends[self.by_start]
+        furthest_end = np.empty_like(ends)
+        furthest_end[0] = starts[0] - 1
+        furthest_end[1:] = np.maximum.accumulate(ends)[:-1]
+
+        new_sections = ends - np.maximum(starts, furthest_end + 1) + 1
+
+        return int(np.clip(new_sections, 0, None).sum())
@@ -1,16 +1,44 @@
 # Advent of Code Day 5 solution code
 
+from typing import Iterable, Tuple, Union
+
+Move = Union[str, Tuple[int, int, int]]
+
+
 class CrateShip:
     def __init__(self, stacks):
-        # Put a None at index 0 so stack numbers match indices
-        self.stacks = [None] + stacks
+        # Put a None at index 0 so stack numbers match indices.
+        # Stacks are copied since they are modified in place.
+        self.stacks = [None] + [list(stack) for stack in stacks]
 
     def move_crates(self,
                     num_crates: int,
                     from_stack: int,
                     to_stack: int) -> None:
-        for _ in range(num_crates):
-            self.stacks[to_stack].append(self.stacks[from_stack].pop())
+        """Moves crates one at a time, so they land in reverse order"""
+        if num_crates <= 0:
+            return
+
+        source = self.stacks[from_stack]
+        if num_crates > len(source):
+            raise IndexError(f"Can't move {num_crates} crates from a stack of {len(source)}")
+        self.stacks[to_stack].extend(reversed(source[-num_crates:]))
+        del source[-num_crates:]
+
+    def apply_moves(self, moves: Iterable[Move]) -> None:
+        """
+        Runs every move in order. Moves can be (num_crates, from, to) tuples
+        or "move N from A to B" lines, eg straight from an open file, so a
+        move list is processed as a stream without being stored.
+        """
+        for move in moves:
+            if isinstance(move, str):
+                words = move.split()
+                if not words:
+                    continue
+                move = (int(words[1]), int(words[3]), int(words[5]))
+
+            self.move_crates(*move)
 
     def get_stacks(self):
         return self.stacks[1:]
@@ -29,9 +57,14 @@ class CrateMover(CrateShip):
                     num_crates: int,
                     from_stack: int,
                     to_stack: int) -> None:
-        # Remove num_crates from the end of from_stack
-        moving_crates = self.stacks[from_stack][-num_crates:]
-        self.stacks[from_stack] = self.stacks[from_stack][:-num_crates]
+        """Moves a block of crates at once, keeping their order"""
+        if num_crates <= 0:
+            return
 
-        # Put the removed crates on top of to_stack
-        self.stacks[to_stack] = self.stacks[to_stack] + moving_crates
+        # Copy the top num_crates onto to_stack, then drop them from from_stack.
+        # Only the moving crates are touched, never the rest of either stack.
+        source = self.stacks[from_stack]
+        if num_crates > len(source):
+            raise IndexError(f"Can't move {num_crates} crates from a stack of {len(source)}")
+        self.stacks[to_stack].extend(source[-num_crates:])
+        del source[-num_crates:]
@@ -1,19 +1,54 @@
 # Advent of Code Day 6 solution code
 
-def find_marker(packet: str, marker_len: int) -> int:
+from typing import BinaryIO, Iterable, TextIO, Union
+
+Packet = Union[str, bytes, BinaryIO, TextIO, Iterable[Union[str, bytes]]]
+
+# Reading a line ending means the packet is over
+LINE_ENDINGS = {'\n', '\r', ord('\n'), ord('\r')}
+
+
+def find_marker(packet: Packet, marker_len: int, chunk_size: int = 64 * 1024) -> int:
     """
     Scans packet for the first consecutive sequence of distinct characters
     of length marker_len.
     Returns the index following the marker, or -1 if not found.
+    packet can be a str or bytes, a file object (read chunk_size at a time)
+    or any iterable of str/bytes chunks, so a packet far larger than memory
+    can be scanned in a single pass. Scanning stops at the first line ending.
     """
-    for i in range(marker_len, len(packet)):
-        if len(set(packet[i-marker_len:i])) == marker_len:
-            return i
+    if isinstance(packet, (str, bytes)):
+        chunks = [packet]
+    elif hasattr(packet, 'read'):
+        # read(0) is '' or b'' depending on the file mode: the EOF sentinel
+        chunks = iter(lambda: packet.read(chunk_size), packet.read(0))
+    else:
+        chunks = packet
+
+    # Index each character was last seen at. The current window of distinct
+    # characters starts just after the last repeated one.
+    last_seen = {}
+    window_start = 0
+    i = 0
+
+    for chunk in chunks:
+        for char in chunk:
+            if char in LINE_ENDINGS:
+                return -1
+
+            seen_at = last_seen.get(char, -1)
+            if seen_at >= window_start:
+                window_start = seen_at + 1
+            last_seen[char] = i
+            i += 1
+
+            if i - window_start == marker_len:
+                return i
 
     return -1
 
 
-def find_packet_start(packet: str) -> int:
+def find_packet_start(packet: Packet) -> int:
     """
     Finds the first occurence of the packet start marker, i.e. four distinct
     consecutive characters in the input string.
@@ -21,7 +56,7 @@ def find_packet_start(packet: str) -> int:
     return find_marker(packet, marker_len=4)
 
 
-def find_message_start(packet: str) -> int:
+def find_message_start(packet: Packet) -> int:
     """
     Finds the start of message, marker_length = 14
     """
@@ -1,11 +1,47 @@
-from typing import List, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 # Advent of Code Day 7 solution code
 
 
+class Directory:
+    """
+    A directory node. Its size is the total of every file beneath it and is
+    kept up to date as files are added, so reading it is O(1).
+    """
+    __slots__ = ('name', 'parent', 'subdirs', 'files', 'size')
+
+    def __init__(self, name: str, parent: Optional['Directory'] = None) -> None:
+        self.name = name
+        self.parent = parent
+        self.subdirs: Dict[str, Directory] = {}
+        self.files: Dict[str, int] = {}
+        self.size = 0
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.subdirs or name in self.files
+
+    def __getitem__(self, name: str):
+        """
+        Dict-style lookup: '.' is this directory's name, '..' its parent,
+        otherwise the named subdirectory or the size of the named file
+        """
+        if name == '.':
+            return self.name
+        elif name == '..' and self.parent is not None:
+            return self.parent
+        elif name in self.subdirs:
+            return self.subdirs[name]
+
+        return self.files[name]
+
+    def __repr__(self) -> str:
+        return f"Directory({self.name!r}, size={self.size}, " \
+               f"subdirs={list(self.subdirs)}, files={self.files})"
+
+
 class FileSystem:
     def __init__(self) -> None:
-        self.root = {'.': '/'}
+        self.root = Directory('/')
         self.current_directory = self.root
 
     def mkdir(self, dir_name: str) -> None:
@@ -14,10 +50,7 @@ class FileSystem:
         a link to its parent.
         """
         if dir_name not in self.current_directory:
-            self.current_directory[dir_name] = {
-                '.': dir_name,
-                '..': self.current_directory
-            }
+            self.current_directory.subdirs[dir_name] = Directory(dir_name, self.current_directory)
         else:
             raise FileExistsError(f"Directory {dir_name} already exists.")
 
@@ -25,8 +58,10 @@ class FileSystem:
         """
         Change the current directory to dir_name
         """
-        if dir_name in self.current_directory:
-            self.current_directory = self.current_directory[dir_name]
+        if dir_name in self.current_directory.subdirs:
+            self.current_directory = self.current_directory.subdirs[dir_name]
+        elif dir_name == '..' and self.current_directory.parent is not None:
+            self.current_directory = self.current_directory.parent
         elif dir_name == '/':
             self.current_directory = self.root
         else:
@@ -34,68 +69,100 @@ class FileSystem:
 
     def touch(self, file_name: str, file_size: int) -> None:
         """
-        Creates a file entry in cwd with the specified size
+        Creates a file entry in cwd with the specified size, and adds the
+        size to cwd and every directory above it
         """
         if file_name not in self.current_directory:
-            self.current_directory[file_name] = file_size
+            self.current_directory.files[file_name] = file_size
         else:
             raise FileExistsError(f"File {file_name} already exists.")
 
-    def get_dir_catalog(self, dir=None) -> List[Tuple[str, int]]:
+        directory = self.current_directory
+        while directory is not None:
+            directory.size += file_size
+            directory = directory.parent
+
+    def get_dir_catalog(self, dir: Directory = None) -> List[Tuple[str, int]]:
         """
-        Recursively builds a catalog of every directory and its size.
+        Builds a catalog of every directory and its size, parents before
+        their subdirectories. Walks the tree with an explicit stack, so deep
+        trees don't hit the recursion limit.
         Returns a list of tuples of (name, size)
         """
         # If no object to size, size from the root
-        if not dir:
-            dir = self.root
-
-        this_dir_name = dir['.']
-        this_dir_size = 0
-        subdir_catalog = []
+        stack = [dir or self.root]
+        catalog = []
 
-        for obj_name, data in dir.items():
-            if type(data) is int:
-                # item is a file
-                this_dir_size += data
-            elif not obj_name.startswith('.'):
-                # item is a dir, skipping . and ..
-                subdir = self.get_dir_catalog(dir=data)
-                subdir_catalog += subdir
+        while stack:
+            directory = stack.pop()
+            catalog.append((directory.name, directory.size))
+            # Push in reverse so subdirectories come out in creation order
+            stack.extend(reversed(directory.subdirs.values()))
 
-                # Only add the child's size to not double-count nested subdirs
-                this_dir_size += subdir[0][1]
+        return catalog
 
-        return [(this_dir_name, this_dir_size)] + subdir_catalog
 
-
-def build_fs_from_terminal(inputs: List[str]) -> None:
+def build_fs_from_terminal(inputs: Iterable[str]) -> FileSystem:
     """
     Driver function to create a FileSystem object based on terminal session
-    (ie, parses the puzzle input)
+    (ie, parses the puzzle input). inputs can be any iterable of lines,
+    eg an open file, and is read one line at a time.
     """
     fs = FileSystem()
 
-    line = 0
-
-    while line < len(inputs):
-        if inputs[line].startswith('$ cd'):
+    for line in inputs:
+        if line.startswith('$ cd'):
             # Change into directory, create if it doesn't exist
-            dir_name = inputs[line][4:].strip()
-            fs.cd(dir_name)
-            line += 1
-        elif inputs[line].startswith('$ ls'):
-            # Read the output of ls until we hit the next command
-            # and insert those files in the cwd
-            line += 1
-            while line < len(inputs) and not inputs[line].startswith('$'):
-                metadata, obj_name = inputs[line].split()
-                if metadata != 'dir':
-                    fs.touch(file_name=obj_name, file_size=int(metadata))
-                else:
-                    fs.mkdir(dir_name=obj_name)
-                line += 1
+            fs.cd(line[4:].strip())
+        elif line.startswith('$ ls'):
+            # The output of ls follows until the next command
+            continue
+        elif line.strip():
+            # A line of ls output: insert the file or directory in the cwd
+            metadata, obj_name = line.split()
+            if metadata != 'dir':
+                fs.touch(file_name=obj_name, file_size=int(metadata))
+            else:
+                fs.mkdir(dir_name=obj_name)
 
     fs.cd('/')
 
     return fs
+
+
+def iter_dir_sizes(inputs: Iterable[str]) -> Iterator[Tuple[str, int]]:
+    """
+    Sizes directories straight from a terminal session without building a
+    FileSystem. Only the sizes of the directories on the current cd path
+    are kept, and each directory's (name, size) is yielded as soon as it is
+    left for good, ie popped off the path by 'cd ..' or 'cd /'. The root
+    comes last.
+    Assumes every directory is listed only once, as in the puzzle input.
+    """
+    path = [['/', 0]]  # [name, size so far] of each directory on the cd path
+
+    def leave_directory() -> Tuple[str, int]:
+        name, size = path.pop()
+        path[-1][1] += size
+        return (name, size)
+
+    for line in inputs:
+        if line.startswith('$ cd'):
+            dir_name = line[4:].strip()
+            if dir_name == '/':
+                while len(path) > 1:
+                    yield leave_directory()
+            elif dir_name == '..':
+                if len(path) == 1:
+                    raise FileNotFoundError("Directory .. does not exist.")
+                yield leave_directory()
+            else:
+                path.append([dir_name, 0])
+        elif line[:1].isdigit():
+            # A file in ls output; 'dir' entries are sized when visited
+            path[-1][1] += int(line.split()[0])
+
+    while len(path) > 1:
+        yield leave_directory()
+
+    yield tuple(path.pop())
@@ -1,103 +1,110 @@
-from itertools import product
-from typing import Iterable, List
+from typing import Callable, List, Union
+
+import numpy as np
 
 # Advent of Code Day 8 solution code
 
+Matrix = Union[List[List[int]], np.ndarray]
+
 
-def get_row_iterators(height: int, width: int) -> List[Iterable]:
+def apply_all_directions(kernel: Callable, tree_matrix: np.ndarray) -> List[np.ndarray]:
     """
-    Returns a list of iterators containing (r, c) coordinates over each row
-    in a matrix of size height x width going left to right and right
-    to left, as well as each column going top to bottom and bottom to top.
+    Runs a kernel that looks from each tree towards the left edge (column 0)
+    for all 4 directions, by flipping and transposing the matrix so the
+    direction being checked is always "left".
+    Returns the kernel results for left, right, up and down, each oriented
+    the same as tree_matrix.
     """
-    row_iterators = []
+    # Copy each orientation to contiguous memory so the kernels run along rows
+    return [
+        kernel(tree_matrix),
+        np.flip(kernel(np.ascontiguousarray(np.flip(tree_matrix, axis=1))), axis=1),
+        kernel(np.ascontiguousarray(tree_matrix.T)).T,
+        np.flip(kernel(np.ascontiguousarray(np.flip(tree_matrix.T, axis=1))), axis=1).T,
+    ]
 
-    # Scan right and left
-    for row in range(height):
-        row_iterators.append(product([row], range(width)))
-        row_iterators.append(product([row], range(width-1, -1, -1)))
 
-    # Scan up and down
-    for col in range(width):
-        row_iterators.append(product(range(height), [col]))
-        row_iterators.append(product(range(height-1, -1, -1), [col]))
+def visible_from_left(tree_matrix: np.ndarray) -> np.ndarray:
+    """
+    A tree is visible from the left edge if it is taller than the running
+    max of all the trees before it in its row
+    """
+    before_max = np.full(tree_matrix.shape, -1, dtype=np.int8)
+    before_max[:, 1:] = np.maximum.accumulate(tree_matrix, axis=1)[:, :-1]
 
-    return row_iterators
+    return tree_matrix > before_max
 
 
-def get_visible_matrix(tree_matrix: List[List[int]]) -> List[List[bool]]:
+def viewing_distance_left(tree_matrix: np.ndarray) -> np.ndarray:
+    """
+    Number of trees visible looking left from each tree, ie the distance to
+    the nearest tree to the left at least as tall (or to the edge).
+    Makes a single pass over the columns, keeping a table of the last column
+    in each row where a tree of at least each height stood, so each tree's
+    blocker is one lookup.
+    """
+    num_rows, width = tree_matrix.shape
+    # Smallest dtype that fits a column index, to keep memory traffic down
+    index_dtype = np.int16 if width < 2**15 else np.int32
+    num_heights = int(tree_matrix.max(initial=0)) + 1
+    heights = np.arange(num_heights, dtype=tree_matrix.dtype)[:, np.newaxis]
+    rows = np.arange(num_rows)
+
+    # last_seen[h, r] is the last column in row r with a tree >= h so far.
+    # With no blocker the view reaches the edge at column 0.
+    last_seen = np.zeros((num_heights, num_rows), dtype=index_dtype)
+    distances = np.empty((width, num_rows), dtype=index_dtype)
+    # Scratch buffers reused for every column
+    lookup = np.empty(num_rows, dtype=np.intp)
+    blocks = np.empty(last_seen.shape, dtype=bool)
+    seen_here = np.empty(last_seen.shape, dtype=index_dtype)
+
+    # Walk a transposed copy so each column is contiguous. Keeping col in
+    # index_dtype spares the ufuncs below a cast from a Python int.
+    cols = np.arange(width, dtype=index_dtype)
+    for col, column in zip(cols, np.ascontiguousarray(tree_matrix.T)):
+        np.multiply(column, num_rows, out=lookup, dtype=np.intp)
+        np.add(lookup, rows, out=lookup)
+        np.subtract(col, last_seen.take(lookup), out=distances[col])
+
+        # Columns only increase, so a max records col for every height it blocks
+        np.less_equal(heights, column, out=blocks)
+        np.multiply(blocks, col, out=seen_here)
+        np.maximum(last_seen, seen_here, out=last_seen)
+
+    return distances.T
+
+
+def get_visible_matrix(tree_matrix: Matrix) -> np.ndarray:
     """
     Given a matrix of tree heights of HxW, determine which trees are visible
-    Returns a HxW matrix of bools corresponding to the trees at the same
-    coordinates
+    Returns a HxW np.ndarray (not a list of lists) of bools corresponding to
+    the trees at the same coordinates
     """
-    height = len(tree_matrix)
-    width = len(tree_matrix[0])
-    row_iterators = get_row_iterators(height, width)
-    visible_matrix = [[False for _ in range(width)] for _ in range(height)]
-
-    # Iterate each row (up/down/right/left)
-    for row in row_iterators:
-        max_height = -1
-
-        for r, c in row:
-            if tree_matrix[r][c] > max_height:
-                max_height = tree_matrix[r][c]
-                visible_matrix[r][c] = True
+    tree_matrix = np.asarray(tree_matrix, dtype=np.int8)
+    left, right, up, down = apply_all_directions(visible_from_left, tree_matrix)
 
-    return visible_matrix
+    return left | right | up | down
 
 
-def count_visible(visible_matrix: List[List[bool]]) -> int:
+def count_visible(visible_matrix: Matrix) -> int:
     """Counts the True values in the visible matrix"""
-    height = len(visible_matrix)
-    width = len(visible_matrix[0])
-    visible_count = 0
+    return int(np.count_nonzero(visible_matrix))
 
-    for r, c in product(range(height), range(width)):
-        if visible_matrix[r][c]:
-            visible_count += 1
 
-    return visible_count
-
-
-def get_scenic_matrix(tree_matrix: List[List[int]]) -> List[List[int]]:
+def get_scenic_matrix(tree_matrix: Matrix) -> np.ndarray:
     """
     Given a matrix of tree heights of HxW, determine the "scenic score" for
     the tree at each location in the matrix.
-    Returns a HxW matrix of ints corresponding to the trees at the same
-    coordinates
+    Returns a HxW np.ndarray (not a list of lists) of ints corresponding to
+    the trees at the same coordinates
     """
-    height = len(tree_matrix)
-    width = len(tree_matrix[0])
-    max_height = 10  # Technically it's 9, but zero-indexed
-    row_iterators = get_row_iterators(height, width)
-    scenic_matrix = [[1 for _ in range(width)] for _ in range(height)]
-
-    # Iterate each row (up/down/right/left)
-    for row in row_iterators:
-        next_score_for_height = [0 for _ in range(max_height)]
-
-        for r, c in row:
-            this_height = tree_matrix[r][c]
-            scenic_matrix[r][c] *= next_score_for_height[this_height]
+    tree_matrix = np.asarray(tree_matrix, dtype=np.int8)
+    left, right, up, down = apply_all_directions(viewing_distance_left, tree_matrix)
 
-            for height in range(max_height):
-                if height > this_height:
-                    next_score_for_height[height] += 1
-                else:
-                    next_score_for_height[height] = 1
+    return left.astype(np.int64) * right * up * down
 
-    return scenic_matrix
 
-
-def matrix_max(scenic_matrix: List[List[int]]) -> int:
+def matrix_max(scenic_matrix: Matrix) -> int:
     """Finds max value in a 2D matrix"""
-    height = len(scenic_matrix)
-    width = len(scenic_matrix[0])
-    max_score = 0
-
-    for r, c in product(range(height), range(width)):
-        max_score = max(scenic_matrix[r][c], max_score)
-
-    return max_score
+    return int(np.max(scenic_matrix))
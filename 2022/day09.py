@@ -1,11 +1,162 @@
+from array import array
+from typing import Callable, Dict, Iterable, Iterator, Tuple
+
 # Advent of Code Day 9 solution code
 
+MOVES = {
+    'R': (1, 0),
+    'L': (-1, 0),
+    'U': (0, 1),
+    'D': (0, -1),
+}
+
+Cell = Tuple[int, int]
+
+
+class VisitedCells:
+    """Base for the compact stores of visited cells, which compare like sets of tuples"""
+    def __eq__(self, other) -> bool:
+        return len(self) == len(other) and all(cell in self for cell in other)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({set(self)})"
+
+
+class PackedVisited(VisitedCells):
+    """
+    Set of visited (x, y) cells, each stored as a single int key with x in
+    the high 32 bits and y in the low 32 bits instead of as a tuple.
+    Works like a set of tuples for add(), update(), len() and in.
+    Each key is still an int object in a set, so this only takes about half
+    the memory of a set of tuples; BitmapVisited is the one that saves ~10x,
+    on walks that fill their bounding box densely.
+    Coordinates must fit in signed 32 bits, otherwise ValueError is raised.
+    """
+    OFFSET = 1 << 31  # Shifts signed 32 bit coordinates to unsigned
+    MASK = (1 << 32) - 1
+
+    def __init__(self, cells: Iterable[Cell] = ()) -> None:
+        self.keys = set()
+        self.update(cells)
+
+    @classmethod
+    def pack(cls, x: int, y: int) -> int:
+        if not (-cls.OFFSET <= x < cls.OFFSET and -cls.OFFSET <= y < cls.OFFSET):
+            raise ValueError(f"Cell {(x, y)} is outside the signed 32 bit range")
+
+        return (x + cls.OFFSET) << 32 | (y + cls.OFFSET)
+
+    @classmethod
+    def unpack(cls, key: int) -> Cell:
+        return ((key >> 32) - cls.OFFSET, (key & cls.MASK) - cls.OFFSET)
+
+    def add(self, cell: Cell) -> None:
+        self.keys.add(self.pack(*cell))
+
+    def update(self, cells: Iterable[Cell]) -> None:
+        pack = self.pack
+        self.keys.update(pack(x, y) for x, y in cells)
+
+    def __contains__(self, cell: Cell) -> bool:
+        try:
+            return self.pack(*cell) in self.keys
+        except ValueError:
+            # Cells outside the packed range can't have been added
+            return False
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __iter__(self) -> Iterator[Cell]:
+        return map(self.unpack, self.keys)
+
+
+class BitmapVisited(VisitedCells):
+    """
+    Set of visited (x, y) cells stored as one bit per cell in a bytearray
+    covering the bounding box seen so far, 8 cells of a row per byte. Memory
+    grows with the box's area rather than the cells visited, so only use it
+    for walks known to fill their box densely; PackedVisited is the default.
+    The box doubles towards any cell that lands outside it, so the rows
+    are only copied O(log n) times.
+    """
+    def __init__(self, cells: Iterable[Cell] = (), size: int = 64) -> None:
+        size = max(8, size - size % 8)  # Width must be whole bytes
+        self.x0 = self.y0 = -(size // 2)
+        self.width = self.height = size
+        self.bits = bytearray(size * size // 8)
+        self.count = 0
+        self.update(cells)
+
+    def grow(self, x: int, y: int) -> None:
+        """Doubles the bounding box towards (x, y) until (x, y) is inside it"""
+        x0, y0, width, height = self.x0, self.y0, self.width, self.height
+
+        while not x0 <= x < x0 + width:
+            x0 -= width if x < x0 else 0
+            width *= 2
+        while not y0 <= y < y0 + height:
+            y0 -= height if y < y0 else 0
+            height *= 2
+
+        # Copy each old row into place; x0 only ever moves by whole bytes
+        old_stride, stride = self.width // 8, width // 8
+        first_byte = (self.x0 - x0) // 8
+        bits = bytearray(stride * height)
+        for row in range(self.height):
+            start = (row + self.y0 - y0) * stride + first_byte
+            bits[start:start + old_stride] = self.bits[row * old_stride:(row + 1) * old_stride]
+
+        self.x0, self.y0, self.width, self.height, self.bits = x0, y0, width, height, bits
+
+    def add(self, cell: Cell) -> None:
+        x, y = cell
+        col, row = x - self.x0, y - self.y0
+        if not (0 <= col < self.width and 0 <= row < self.height):
+            self.grow(x, y)
+            col, row = x - self.x0, y - self.y0
+
+        i = (row * self.width + col) >> 3
+        bit = 1 << (col & 7)
+        if not self.bits[i] & bit:
+            self.bits[i] |= bit
+            self.count += 1
+
+    def update(self, cells: Iterable[Cell]) -> None:
+        for cell in cells:
+            self.add(cell)
+
+    def __contains__(self, cell: Cell) -> bool:
+        x, y = cell
+        col, row = x - self.x0, y - self.y0
+        if not (0 <= col < self.width and 0 <= row < self.height):
+            return False
+
+        return bool(self.bits[(row * self.width + col) >> 3] & 1 << (col & 7))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[Cell]:
+        stride = self.width // 8
+        for i, byte in enumerate(self.bits):
+            while byte:
+                lowest_bit = byte & -byte
+                row, col_byte = divmod(i, stride)
+                yield (self.x0 + col_byte * 8 + lowest_bit.bit_length() - 1, self.y0 + row)
+                byte ^= lowest_bit
+
 
 class Rope:
-    def __init__(self) -> None:
+    def __init__(self, visited_store: Callable[[], VisitedCells] = PackedVisited) -> None:
+        """
+        visited_store makes the container for tail_visited: PackedVisited,
+        BitmapVisited for walks known to be dense, or set to keep plain tuples
+        """
         self.head = (0, 0)
         self.tail = (0, 0)
-        self.tail_visited = set([self.tail])
+        self.tail_visited = visited_store()
+        self.tail_visited.add(self.tail)
 
     def move_head(self, dx: int, dy: int) -> None:
         """
@@ -36,59 +187,64 @@ class Rope:
         and adds the new position to the set of visited tail coordinates
         """
         self.tail = (new_x, new_y)
-        self.tail_visited.update([self.tail])
+        self.tail_visited.add(self.tail)
 
     def move(self, direction: str, steps: int) -> None:
         """
         Moves the rope head in the specified direction (R, L, U, D)
         by the specified number of steps
         """
-        moves = {
-            'R': (1, 0),
-            'L': (-1, 0),
-            'U': (0, 1),
-            'D': (0, -1),
-        }
-        if direction not in moves:
+        if direction not in MOVES:
             raise ValueError("direction must be one of: R, L, U, D")
 
-        dx, dy = moves[direction]
+        dx, dy = MOVES[direction]
 
         for _ in range(steps):
             self.move_head(dx, dy)
 
 
 class LongRope(Rope):
-    def __init__(self, num_knots: int = 10) -> None:
-        self.knots = {k: (0, 0) for k in range(num_knots)}
-        self.tail_visited = set([self.knots[num_knots-1]])
+    def __init__(self, num_knots: int = 10,
+                 visited_store: Callable[[], VisitedCells] = PackedVisited) -> None:
+        # Knot coordinates, head first
+        self.xs = array('i', [0] * num_knots)
+        self.ys = array('i', [0] * num_knots)
+        self.tail_visited = visited_store()
+        self.tail_visited.add((0, 0))
         self.tail_knot = num_knots-1
 
-    def move_knot(self, knot: int, new_x: int, new_y: int) -> None:
+    @property
+    def knots(self) -> Dict[int, Tuple[int, int]]:
+        """Coordinates of every knot, keyed by knot number"""
+        return {k: (x, y) for k, (x, y) in enumerate(zip(self.xs, self.ys))}
+
+    def pull_knots(self) -> bool:
         """
-        Moves the specified know head in _either_ the x or y direction by dx or dy.
-        Recursively moves all following knots accordingly
+        After the head moves, moves each following knot one step towards the
+        knot in front of it if they are no longer touching. Stops as soon as a
+        knot doesn't need to move, since no knot behind it will either.
+        Returns True if the tail moved.
         """
-        if knot == self.tail_knot:
-            # If updating the tail knot, update coordinates & visited set only
-            # This is the base case for updating recursively.
-            self.knots[knot] = (new_x, new_y)
-            self.tail_visited.update([self.knots[knot]])
+        xs, ys = self.xs, self.ys
 
-            return
+        for knot in range(1, len(xs)):
+            diff_x, diff_y = xs[knot-1] - xs[knot], ys[knot-1] - ys[knot]
+            if -1 <= diff_x <= 1 and -1 <= diff_y <= 1:
+                return False
 
-        current_head_x, current_head_y = self.knots[knot]
-        current_tail_x, current_tail_y = self.knots[knot+1]
-        self.knots[knot] = (new_x, new_y)
+            xs[knot] += (diff_x > 0) - (diff_x < 0)
+            ys[knot] += (diff_y > 0) - (diff_y < 0)
 
-        # Calculate distance between new head and current tail positions
-        diff_x, diff_y = new_x - current_tail_x, new_y - current_tail_y
+        self.tail_visited.add((xs[-1], ys[-1]))
 
-        # Tail needs to move only if now separated by 2 in either dimension
-        if abs(diff_x) < 2 and abs(diff_y) < 2:
-            self.move_knot(knot=knot+1, new_x=current_tail_x, new_y=current_tail_y)
-        else:  # Otherwise, tail moves to spot previously occupied by the head
-            self.move_knot(knot=knot+1, new_x=current_head_x, new_y=current_head_y)
+        return True
+
+    def is_straight(self, dx: int, dy: int) -> bool:
+        """True if each knot is exactly one step behind the last in the (dx, dy) direction"""
+        head_x, head_y = self.xs[0], self.ys[0]
+
+        return all(x == head_x - k*dx and y == head_y - k*dy
+                   for k, (x, y) in enumerate(zip(self.xs, self.ys)))
 
     def move_head(self, dx: int, dy: int) -> None:
         """Overrides super().move_head(dx, dy) to move the first knot"""
@@ -97,6 +253,32 @@ class LongRope(Rope):
         if abs(dx) > 1 or abs(dy) > 1:
             raise ValueError("Can only move head 1 unit at a time")
 
-        head_x, head_y = self.knots[0]
-        new_x, new_y = head_x + dx, head_y + dy
-        self.move_knot(knot=0, new_x=new_x, new_y=new_y)
\ No newline at end of file
+        self.xs[0] += dx
+        self.ys[0] += dy
+        self.pull_knots()
+
+    def move(self, direction: str, steps: int) -> None:
+        """
+        Moves the rope head in the specified direction (R, L, U, D)
+        by the specified number of steps.
+        Once the whole rope is pulled straight behind the head, every knot
+        just moves the remaining steps with it, so those are done at once.
+        """
+        if direction not in MOVES:
+            raise ValueError("direction must be one of: R, L, U, D")
+
+        dx, dy = MOVES[direction]
+
+        for step in range(steps):
+            self.xs[0] += dx
+            self.ys[0] += dy
+
+            # The rope can only have become straight if the tail moved
+            if self.pull_knots() and self.is_straight(dx, dy):
+                remaining = steps - step - 1
+                tail_x, tail_y = self.xs[-1], self.ys[-1]
+                self.xs = array('i', (x + remaining*dx for x in self.xs))
+                self.ys = array('i', (y + remaining*dy for y in self.ys))
+                self.tail_visited.update((tail_x + i*dx, tail_y + i*dy)
+                                         for i in range(1, remaining + 1))
+                return
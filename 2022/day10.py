@@ -1,19 +1,37 @@
-from typing import List, Tuple
+from typing import List, Sequence, Tuple, Union
+
+import numpy as np
+
+SIGNAL_CYCLES = (20, 60, 100, 140, 180, 220)
 
 
 class CrtCpu:
     DISPLAY_WIDTH = 40
     DISPLAY_HEIGHT = 6
 
-    def __init__(self) -> None:
+    def __init__(self, compiled: bool = False) -> None:
+        """
+        With compiled=True, execute_program() keeps only the cycles where the
+        register changes instead of appending to register_history every cycle
+        """
+        self.compiled = compiled
         self.register_history = [1]
         self.display = [['' for _ in range(self.DISPLAY_WIDTH)]
                         for _ in range(self.DISPLAY_HEIGHT)]
 
+        # Compiled mode: history index each register value starts at, and the value
+        self.change_indexes = np.zeros(1, dtype=np.int64)
+        self.change_values = np.ones(1, dtype=np.int64)
+        self.compiled_len = 1
+
     def execute_program(self, instructions: List[Tuple[str, int]]) -> None:
         """
         Executes the given program input, appending to the register_history
         """
+        if self.compiled:
+            self.compile_program(instructions)
+            return
+
         for instruction in instructions:
             current_x = self.register_history[-1]
 
@@ -25,19 +43,57 @@ class CrtCpu:
             else:
                 raise ValueError(f"Illegal instruction: {instruction}")
 
-    def get_signal_strength(self) -> None:
+    def compile_program(self, instructions: List[Tuple[str, int]]) -> None:
+        """
+        Turns the program into arrays: every instruction takes 1 cycle plus 1
+        for addx, so a cumsum of the cycle counts gives the history index
+        where each addx result lands, and a cumsum of the addx operands gives
+        the register value from that index on.
+        """
+        for instruction in instructions:
+            if instruction[0] not in ('addx', 'noop'):
+                raise ValueError(f"Illegal instruction: {instruction}")
+
+        is_addx = np.array([instruction[0] == 'addx' for instruction in instructions], dtype=bool)
+        operands = np.array([instruction[1] for instruction in instructions
+                             if instruction[0] == 'addx'], dtype=np.int64)
+        end_indexes = self.compiled_len - 1 + np.cumsum(1 + is_addx)
+
+        self.change_indexes = np.concatenate((self.change_indexes, end_indexes[is_addx]))
+        self.change_values = np.concatenate((self.change_values,
+                                             self.change_values[-1] + np.cumsum(operands)))
+        if len(end_indexes):
+            self.compiled_len = int(end_indexes[-1]) + 1
+
+    @property
+    def history_length(self) -> int:
+        """Length register_history has (or would have, when compiled)"""
+        return self.compiled_len if self.compiled else len(self.register_history)
+
+    def register_at(self, index: Union[int, Sequence[int], np.ndarray]):
+        """
+        Value of the register at the END of cycle index (ie register_history[index]),
+        for a single index or an array of them
+        """
+        index = np.asarray(index)
+        if np.any((index < 0) | (index >= self.history_length)):
+            raise IndexError("Cycle is outside of the program")
+
+        if not self.compiled:
+            return np.asarray(self.register_history)[index]
+
+        return self.change_values[np.searchsorted(self.change_indexes, index, side='right') - 1]
+
+    def get_signal_strength(self, cycles: Sequence[int] = SIGNAL_CYCLES) -> int:
         """
         Calculates signal strength as defined in the problem, as the sum of
         cycle * register_at_cycle_start for cycles 20, 60, 100, 140, 180, 220
         ***Note that the register at cycle START is the value at cycle_num - 1,
         as the registry history reflects the register value at the cycle END
         """
-        signal_strength = 0
-        for cycle in [20, 60, 100, 140, 180, 220]:
-            register = self.register_history[cycle-1]
-            signal_strength += cycle * register
+        cycles = np.asarray(cycles, dtype=np.int64)
 
-        return signal_strength
+        return int(np.sum(cycles * self.register_at(cycles - 1)))
 
     def draw_display(self, blank_char: str = ".") -> None:
         """
@@ -45,14 +101,15 @@ class CrtCpu:
         based on the current value of the x register.
         """
         # The value of the register AFTER the last cycle is executed is ignored
-        for cycle_num, register in enumerate(self.register_history[:-1]):
-            row = cycle_num // self.DISPLAY_WIDTH
-            col = cycle_num % self.DISPLAY_WIDTH
+        num_pixels = self.DISPLAY_WIDTH * self.DISPLAY_HEIGHT
+        cycles = np.arange(min(self.history_length - 1, num_pixels))
 
-            if abs(register - col) < 2:
-                self.display[row][col] = '#'
-            else:
-                self.display[row][col] = blank_char
+        # Lit wherever the 3 pixel wide sprite covers the column being drawn
+        lit = np.abs(self.register_at(cycles) - cycles % self.DISPLAY_WIDTH) < 2
+
+        pixels = np.full(num_pixels, '', dtype='<U1')
+        pixels[:len(cycles)] = np.where(lit, '#', blank_char)
+        self.display = pixels.reshape(self.DISPLAY_HEIGHT, self.DISPLAY_WIDTH).tolist()
 
     def print_display(self) -> None:
         """Prints the display to stdout"""
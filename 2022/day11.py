@@ -1,5 +1,6 @@
 from itertools import product
-from typing import Callable, List, Tuple
+from math import lcm
+from typing import Callable, Dict, List, Tuple
 
 
 class BarrelOfMonkeys:
@@ -17,6 +18,14 @@ class BarrelOfMonkeys:
     def add_monkey(self, monkey) -> None:
         self.monkeys.append(monkey)
 
+    @property
+    def worry_modulus(self) -> int:
+        """
+        LCM of every monkey's test condition. Reducing worry levels modulo
+        this doesn't change the result of any monkey's test.
+        """
+        return lcm(*(monkey.test_condition for monkey in self.monkeys))
+
     def play(self,
              num_rounds: int,
              starting_monkey: int = 0,
@@ -25,12 +34,96 @@ class BarrelOfMonkeys:
         Tell each monkey in turn to take its turn, until the specified number
         of turns has been completed.
         Note: 1 round is every monkey in the barrel taking its turn
+        When no monkey reduces worry levels by dividing by 3, the rounds are
+        played item by item with play_items() instead, unless chatty.
         """
+        # Dividing by 3 doesn't commute with reducing modulo the LCM, so
+        # worry levels can only be kept small if no monkey divides
+        any_reduce_level = any(monkey.reduce_level for monkey in self.monkeys)
+        if not chatty and not any_reduce_level:
+            self.play_items(num_rounds)
+            return
+
+        modulus = None if any_reduce_level else self.worry_modulus
         num_monkeys = len(self.monkeys)
         for _, monkey_num in product(range(num_rounds), range(num_monkeys)):
             if chatty:
                 print(f"Monkey {monkey_num}:")
-            self.monkeys[monkey_num].take_turn(chatty)
+            self.monkeys[monkey_num].take_turn(chatty, modulus)
+
+    def item_round(self, monkey_num: int, item: int, modulus: int,
+                   inspections: List[int]) -> Tuple[int, int]:
+        """
+        Plays one round for a single item starting the round with monkey_num,
+        adding to inspections for each monkey that inspects it.
+        An item thrown to a later monkey is inspected again in the same
+        round; thrown to an earlier one, it waits for the next round.
+        Returns the (monkey_num, item) the item starts the next round with.
+        """
+        while True:
+            monkey = self.monkeys[monkey_num]
+            inspections[monkey_num] += 1
+            item = monkey.operation(item) % modulus
+            recipient = monkey._test(item)
+            if recipient <= monkey_num:
+                return recipient, item
+            monkey_num = recipient
+
+    def play_items(self, num_rounds: int) -> None:
+        """
+        Plays num_rounds without dividing worry levels by 3. Items never
+        affect each other, so each item is followed on its own, with worry
+        levels kept modulo worry_modulus. That leaves finitely many
+        (monkey, worry level) states, so once an item starts a round in a
+        state it has been in before, the rest of its rounds repeat that cycle
+        and the inspections are added up without playing them.
+        Items end up with the right monkey and worry level, but not
+        necessarily in the order turn-by-turn play would give.
+        """
+        modulus = self.worry_modulus
+        num_monkeys = len(self.monkeys)
+        final_items = [[] for _ in range(num_monkeys)]
+        total_inspections = [0] * num_monkeys
+
+        start_items = [(monkey_num, item)
+                       for monkey_num, monkey in enumerate(self.monkeys)
+                       for item in monkey.items]
+
+        for state in start_items:
+            # Round each state was first seen at, and inspections before each round
+            seen: Dict[Tuple[int, int], int] = {}
+            states = []
+            history = []
+            inspections = [0] * num_monkeys
+
+            for current_round in range(num_rounds):
+                if state in seen:
+                    break
+                seen[state] = current_round
+                states.append(state)
+                history.append(inspections.copy())
+                state = self.item_round(*state, modulus, inspections)
+            else:
+                current_round = num_rounds
+
+            if current_round < num_rounds:
+                # Skip whole cycles, then play out the remainder from history
+                cycle_start = seen[state]
+                cycles, remainder = divmod(num_rounds - current_round,
+                                           current_round - cycle_start)
+                start, end = history[cycle_start], history[cycle_start + remainder]
+                inspections = [count + cycles * (count - start_count) + end_count - start_count
+                               for count, start_count, end_count
+                               in zip(inspections, start, end)]
+                state = states[cycle_start + remainder]
+
+            monkey_num, item = state
+            final_items[monkey_num].append(item)
+            total_inspections = [a + b for a, b in zip(total_inspections, inspections)]
+
+        for monkey, items, inspections in zip(self.monkeys, final_items, total_inspections):
+            monkey.items = items
+            monkey.inspections += inspections
 
     def get_inspection_counts(self) -> List[int]:
         """Polls each monkey to see how many inspections they have done"""
@@ -63,14 +156,26 @@ class Monkey:
         self.reduce_level = True  # When True, divides worry level by 3 each turn
         self.inspections = 0
 
-    def take_turn(self, chatty=False) -> None:
-        """Inspect every item in the items queue"""
-        while len(self.items) > 0:
+    def take_turn(self, chatty=False, modulus: int = None) -> None:
+        """
+        Inspect every item in the items queue. The whole queue is taken at
+        once, since a monkey never throws to itself.
+        Without dividing by 3, worry levels are kept modulo modulus (when
+        given) so they stay small. Only pass the barrel's worry_modulus when
+        no monkey in the barrel divides by 3.
+        """
+        items, self.items = self.items, []
+
+        for current_item in items:
             self.inspections += 1
-            current_item = self.items.pop(0)
             modified_item = self.operation(current_item)
 
-            reduced_item = modified_item // 3 if self.reduce_level else modified_item
+            if self.reduce_level:
+                reduced_item = modified_item // 3
+            elif modulus:
+                reduced_item = modified_item % modulus
+            else:
+                reduced_item = modified_item
             recipient = self._test(reduced_item)
             self.barrel.throw_item(recipient, reduced_item)
 
@@ -91,10 +196,6 @@ class Monkey:
         else:
             return self.test_false
 
-            
-
-
-
     def receive(self, item: int) -> None:
         """Catch an item from another monkey"""
         self.items.append(item)
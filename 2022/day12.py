@@ -1,47 +1,149 @@
-from aoc_utils.PriorityQueue import PriorityQueue
+from collections import deque
 from itertools import product
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
 
+import numpy as np
 
-def shortest_path(graph: List[List[Tuple[int, int]]]) -> int:
-    pq = PriorityQueue()
+from aoc_utils import Grid
+
+# Advent of Code Day 12 solution code
+
+ELEVATIONS = {c: i for i, c in enumerate('abcdefghijklmnopqrstuvwxyz')}
+ELEVATIONS['S'] = ELEVATIONS['a']
+ELEVATIONS['E'] = ELEVATIONS['z']
+
+# (dr, dc) of the 4 neighbors, in row-major order. Neighbor i is bit i of an
+# adjacency mask.
+NEIGHBOR_OFFSETS = [(-1, 0), (0, -1), (0, 1), (1, 0)]
+
+
+def get_elevation_array(graph: List[List[str]]) -> np.ndarray:
+    """Converts the map of letters to an int8 array of elevations 0-25"""
+    lookup = np.zeros(128, dtype=np.int8)
+    for c, elevation in ELEVATIONS.items():
+        lookup[ord(c)] = elevation
+
+    return lookup[Grid.from_lines(graph).array]
+
+
+def get_adjacency_masks(elevations: np.ndarray, reverse: bool = False) -> np.ndarray:
+    """
+    Precomputes which of its 4 neighbors can be visited from every cell.
+    Returns an array the same shape as elevations, where bit i of each
+    cell is set if the step to NEIGHBOR_OFFSETS[i] is in bounds and climbs
+    at most 1.
+    With reverse=True every edge is flipped: bit i is set if the neighbor
+    could step to this cell, ie this cell is at most 1 higher.
+    """
+    height, width = elevations.shape
+    elevations = elevations.astype(np.int16)
+    masks = np.zeros((height, width), dtype=np.uint8)
+
+    for bit, (dr, dc) in enumerate(NEIGHBOR_OFFSETS):
+        # Shifted views pairing every cell with its in-bounds neighbor
+        cells = (slice(max(-dr, 0), height - max(dr, 0)),
+                 slice(max(-dc, 0), width - max(dc, 0)))
+        neighbors = (slice(max(dr, 0), height - max(-dr, 0)),
+                     slice(max(dc, 0), width - max(-dc, 0)))
+
+        if reverse:
+            climbable = elevations[cells] - elevations[neighbors] <= 1
+        else:
+            climbable = elevations[neighbors] - elevations[cells] <= 1
+        masks[cells] |= climbable.astype(np.uint8) << bit
+
+    return masks
+
+
+def bfs(masks: np.ndarray, sources: Iterable[Tuple[int, int]]) -> np.ndarray:
+    """
+    Breadth-first search over the adjacency masks starting from every source
+    at once. Returns the array of step counts to reach each cell, -1 where
+    unreachable.
+    """
+    height, width = masks.shape
+    steps = [dr * width + dc for dr, dc in NEIGHBOR_OFFSETS]
+    # Flat index steps to take for each of the 16 possible masks
+    mask_steps = [[step for bit, step in enumerate(steps) if mask >> bit & 1]
+                  for mask in range(16)]
+    flat_masks = masks.ravel().tolist()
+    distances = [-1] * (height * width)
+    queue = deque()
+
+    for r, c in sources:
+        distances[r * width + c] = 0
+        queue.append(r * width + c)
+
+    while queue:
+        cell = queue.popleft()
+        next_distance = distances[cell] + 1
+
+        for step in mask_steps[flat_masks[cell]]:
+            neighbor = cell + step
+            if distances[neighbor] < 0:
+                distances[neighbor] = next_distance
+                queue.append(neighbor)
+
+    return np.array(distances, dtype=np.int32).reshape(height, width)
+
+
+def find_cells(graph: List[List[str]], chars: str) -> List[Tuple[int, int]]:
+    """Returns the coordinates of every cell in the graph matching any of chars"""
     rows = len(graph)
     cols = len(graph[0])
 
-    # Scan all points and load them into the priority queue, noting the Start
-    for r, c in product(range(rows), range(cols)):
-        pq.add(item=(r, c), priority=0 if graph[r][c] == 'S' else float('inf'))
+    return [(r, c) for r, c in product(range(rows), range(cols)) if graph[r][c] in chars]
+
+
+def get_distance_field(graph: List[List[str]], reverse: bool = False) -> np.ndarray:
+    """
+    Returns the fewest steps from S to every cell, or with reverse=True the
+    fewest steps from every cell to E (found by a single search back from
+    E over reversed edges). Unreachable cells are -1.
+    """
+    masks = get_adjacency_masks(get_elevation_array(graph), reverse=reverse)
 
-    pass
+    return bfs(masks, find_cells(graph, 'E' if reverse else 'S'))
 
-    
 
-def find_adjacent_nodes(graph: List[List[Tuple[int, int]]],
+def shortest_path(graph: List[List[str]], starts: str = 'S', reverse: bool = False) -> int:
+    """
+    Finds the fewest steps from any cell marked with one of the starts
+    characters to E, or -1 if E can't be reached.
+    All of the starts are searched in a single pass, eg starts='Sa' for part 2.
+    With reverse=True the search runs once back from E instead, and the
+    best start is picked from the resulting distance field.
+    """
+    if reverse:
+        distances = get_distance_field(graph, reverse=True)
+        # Grid accepts row strings as well as lists of characters
+        is_start = np.isin(Grid.from_lines(graph).array, [ord(c) for c in starts])
+        start_distances = distances[is_start & (distances >= 0)]
+
+        return int(start_distances.min()) if start_distances.size else -1
+
+    masks = get_adjacency_masks(get_elevation_array(graph))
+    distances = bfs(masks, find_cells(graph, starts))
+    end_r, end_c = find_cells(graph, 'E')[0]
+
+    return int(distances[end_r, end_c])
+
+
+def find_adjacent_nodes(graph: List[List[str]],
                         row: int, col: int) -> List[Tuple[int, int]]:
     """
     Checks the node in the graph at (row, col) and returns a list
     of all adjacent nodes that can be visited
     """
-    elevations = 'SabcdefghijklmnopqrstuvwxyzE'
-    this_node = graph[row][col]
-    this_elevation = elevations.find(this_node)
+    this_elevation = ELEVATIONS[graph[row][col]]
     adjacent_nodes = []
-   
-    # These are the 8 (possibly) adjacent coordinates
-    adjacent_coords = [
-                       (row-1, col-1), (row-1, col), (row-1, col+1),
-                       (row, col-1), (row, col+1),
-                       (row+1, col-1), (row+1, col), (row+1, col+1)
-                      ]
-
-    # Check adjacent sets of coords and see if the node there is adjacent (if any)
-    for adj_row, adj_col in adjacent_coords:
-        if min(adj_row, adj_col) >= 0 and adj_row < len(graph) and adj_col < len(graph[0]):
-            adjacent_node = graph[adj_row][adj_col]
-            adjacent_elevation = elevations.find(adjacent_node)
+
+    for dr, dc in NEIGHBOR_OFFSETS:
+        adj_row, adj_col = row + dr, col + dc
+        if 0 <= adj_row < len(graph) and 0 <= adj_col < len(graph[0]):
+            adjacent_elevation = ELEVATIONS[graph[adj_row][adj_col]]
 
             if adjacent_elevation - this_elevation < 2:
                 adjacent_nodes.append((adj_row, adj_col))
 
     return adjacent_nodes
-    
\ No newline at end of file
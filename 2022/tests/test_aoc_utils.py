@@ -1,4 +1,13 @@
-from aoc_utils import parse_input_file
+import importlib.util
+import os
+import pytest
+import sys
+import types
+
+from aoc_utils import (
+    BucketQueue, Grid, IndexedPriorityQueue, InputCache, get_input_path, get_priority_queue,
+    iter_input_file, iter_input_file_mmap, parse_input_file
+)
 
 
 def test_parse_input_file_reads_plain_file():
@@ -29,3 +38,246 @@ def test_parse_with_parser_reads_input_file():
     assert type(input) is list
     assert len(input) == 6
     assert input[0] == ("vJr", 24)
+
+
+def test_iter_input_file_is_lazy():
+    """
+    iter_input_file() should return a generator yielding the same lines
+    that parse_input_file() returns as a list
+    """
+    lines = iter_input_file("day03ex.txt")
+
+    assert isinstance(lines, types.GeneratorType)
+    assert next(lines) == "vJrwpWtwJgWrhcsFMMfFFhFp"
+    assert len(list(lines)) == 5
+
+
+def test_iter_input_file_mmap_matches_iter_input_file():
+    """
+    The mmap-backed reader should produce identical parsed lines, including
+    for CRLF-terminated input files
+    """
+    def parser(line: str):
+        return line
+
+    expected = list(iter_input_file("day03ex.txt", parser))
+    actual = list(iter_input_file_mmap("day03ex.txt", parser))
+
+    assert actual == expected
+    assert actual[0] == "vJrwpWtwJgWrhcsFMMfFFhFp\n"
+
+
+@pytest.mark.parametrize("data", [
+    b"a\nb\r\nc",
+    b"a\rb\r\rc\r\nd\r",
+    b"\r\r\n\n\xc3\xa9\r",
+])
+def test_iter_input_file_mmap_translates_universal_newlines(tmp_path, data):
+    (tmp_path / "newlines.txt").write_bytes(data)
+
+    def parser(line: str):
+        return line
+
+    expected = list(iter_input_file("newlines.txt", parser, str(tmp_path)))
+    actual = list(iter_input_file_mmap("newlines.txt", parser, str(tmp_path)))
+
+    assert actual == expected
+
+
+def test_input_cache_skips_parsing_unchanged_input(tmp_path):
+    """
+    A second fetch of the same file with the same parser should be served
+    from the cache without calling the loader again
+    """
+    cache = InputCache(str(tmp_path))
+    path = get_input_path("day03ex.txt")
+    loads = []
+
+    def load():
+        loads.append(1)
+        return parse_input_file("day03ex.txt")
+
+    first = cache.fetch(path, str.strip, load)
+    second = cache.fetch(path, str.strip, load)
+
+    assert len(loads) == 1
+    assert first == second
+
+
+def test_input_cache_keys_on_parser_code():
+    """
+    Identical lambdas share a key while a different parser gets its own
+    """
+    path = get_input_path("day03ex.txt")
+    parsers = [lambda line: line.strip() for _ in range(2)]
+
+    assert InputCache.get_key(path, parsers[0]) == InputCache.get_key(path, parsers[1])
+    assert InputCache.get_key(path, parsers[0]) != InputCache.get_key(path, len)
+
+
+def test_input_cache_evicts_least_recently_used(tmp_path):
+    cache = InputCache(str(tmp_path), max_bytes=150)
+    path = get_input_path("day03ex.txt")
+
+    cache.fetch(path, str.strip, lambda: "a" * 100)
+    cache.fetch(path, str.upper, lambda: "b" * 100)
+
+    newer_entry = InputCache.get_key(path, str.upper) + InputCache.SUFFIX
+    assert os.listdir(tmp_path) == [newer_entry]
+
+
+def test_input_cache_keys_on_parser_module_source(tmp_path, monkeypatch):
+    """
+    Editing a helper the parser calls must change the key even though the
+    parser's own code is unchanged
+    """
+    module_path = tmp_path / "cached_parser.py"
+    path = get_input_path("day03ex.txt")
+    keys = []
+
+    for helper_body in ("return line.strip()", "return line.upper()"):
+        module_path.write_text(f"def helper(line):\n    {helper_body}\n\n"
+                               "def parse(line):\n    return helper(line)\n")
+        spec = importlib.util.spec_from_file_location("cached_parser", module_path)
+        module = importlib.util.module_from_spec(spec)
+        monkeypatch.setitem(sys.modules, "cached_parser", module)
+        spec.loader.exec_module(module)
+        keys.append(InputCache.get_key(path, module.parse))
+
+    assert keys[0] != keys[1]
+
+
+def test_input_cache_skips_parsers_with_unhashable_closures(tmp_path):
+    cache = InputCache(str(tmp_path))
+    path = get_input_path("day03ex.txt")
+    helper = str.strip
+    loads = []
+
+    def load():
+        loads.append(1)
+        return []
+
+    def parse(line):
+        return helper(line)
+
+    assert InputCache.get_key(path, parse) is None
+    cache.fetch(path, parse, load)
+    cache.fetch(path, parse, load)
+
+    assert len(loads) == 2
+    assert os.listdir(tmp_path) == []
+
+
+def test_indexed_priority_queue_pops_in_priority_order():
+    pq = IndexedPriorityQueue()
+    for item, priority in [("a", 5), ("b", 1), ("c", 3), ("d", 4), ("e", 2)]:
+        pq.add(item, priority)
+
+    popped = [pq.pop() for _ in range(len(pq))]
+
+    assert popped == [("b", 1), ("e", 2), ("c", 3), ("d", 4), ("a", 5)]
+    with pytest.raises(KeyError):
+        pq.pop()
+
+
+def test_indexed_priority_queue_update_decreases_key_in_place():
+    """
+    update() should only ever lower a priority, and should not grow the heap
+    """
+    pq = IndexedPriorityQueue()
+    for item in range(10):
+        pq.add(item, 10 + item)
+
+    pq.update(7, 1)
+    pq.update(3, 50)  # Higher than current priority: ignored
+
+    assert len(pq.heap) == 10
+    assert pq[3] == 13
+    assert pq.pop() == (7, 1)
+
+
+def test_indexed_priority_queue_setitem_requires_existing_item():
+    pq = IndexedPriorityQueue()
+    pq.add("a", 1)
+    pq.add("b", 2)
+    pq["a"] = 3
+
+    assert pq.contains("a")
+    assert pq.pop() == ("b", 2)
+    with pytest.raises(KeyError):
+        pq["z"] = 1
+
+
+def test_bucket_queue_pops_in_priority_order():
+    pq = BucketQueue()
+    pq.add("unreached")
+    for item, priority in [("a", 5), ("b", 1), ("c", 3), ("d", 9)]:
+        pq.add(item, priority)
+
+    pq.update("d", 2)
+    pq.update("a", 7)  # Higher than current priority: ignored
+
+    popped = [pq.pop() for _ in range(len(pq))]
+
+    assert popped == [("b", 1), ("d", 2), ("c", 3), ("a", 5), ("unreached", float("inf"))]
+    with pytest.raises(KeyError):
+        pq.pop()
+
+
+def test_bucket_queue_rejects_fractional_priority():
+    pq = BucketQueue()
+
+    with pytest.raises(ValueError):
+        pq.add("a", 1.5)
+
+
+def test_get_priority_queue_picks_bucket_queue_for_small_weights():
+    assert isinstance(get_priority_queue(max_edge_weight=9), BucketQueue)
+    assert isinstance(get_priority_queue(max_edge_weight=0.5), IndexedPriorityQueue)
+    assert isinstance(get_priority_queue(), IndexedPriorityQueue)
+
+
+@pytest.mark.parametrize("max_edge_weight", [float("inf"), float("-inf"), float("nan")])
+def test_get_priority_queue_handles_non_finite_weights(max_edge_weight):
+    assert isinstance(get_priority_queue(max_edge_weight), IndexedPriorityQueue)
+
+
+def test_grid_from_file_reads_digits():
+    grid = Grid.from_file(get_input_path("day08ex.txt"), digits=True)
+
+    assert grid.shape == (5, 5)
+    assert grid.to_list()[0] == [3, 0, 3, 7, 3]
+    assert grid == Grid.from_lines(parse_input_file("day08ex.txt"), digits=True)
+
+
+def test_grid_from_bytes_round_trips_text():
+    grid = Grid.from_lines(parse_input_file("day12ex.txt"))
+
+    assert grid.to_list()[0] == ['S', 'a', 'b', 'q', 'p', 'o', 'n', 'm']
+    assert str(grid).split("\n")[4] == "abdefghi"
+
+
+def test_grid_from_bytes_rejects_ragged_rows():
+    with pytest.raises(ValueError):
+        Grid.from_bytes(b"abc\nde\n")
+
+
+def test_grid_from_bytes_rejects_ragged_rows_of_even_total_length():
+    with pytest.raises(ValueError):
+        Grid.from_bytes(b"ab\ncde\nf\n")
+
+
+def test_grid_neighbor_views_are_padded():
+    grid = Grid.from_bytes(b"123\n456\n789\n", digits=True)
+    up, left, right, down = grid.neighbor_views(connectivity=4, fill=-1)
+
+    assert up.tolist() == [[-1, -1, -1], [1, 2, 3], [4, 5, 6]]
+    assert right[1].tolist() == [5, 6, -1]
+    assert grid.shifted(1, 0, fill=-1).tolist() == down.tolist()
+
+
+def test_grid_neighbor_sum_counts_live_neighbors():
+    grid = Grid.from_bytes(b"#..\n.#.\n..#\n")
+    counts = Grid(grid.array == ord("#")).neighbor_sum(connectivity=8)
+
+    assert counts.tolist() == [[1, 2, 1], [2, 2, 2], [1, 2, 1]]
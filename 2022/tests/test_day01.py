@@ -1,7 +1,7 @@
 import os
 import pytest
 
-from day01 import split_groups, sum_groups, sum_top_k
+from day01 import iter_group_sums, split_groups, stream_top_k, sum_groups, sum_top_k
 
 INPUTS_PATH = os.path.join(os.path.dirname(__file__), "inputs/")
 
@@ -117,3 +117,31 @@ def test_part_2(puzzle_input):
 
     # accepted by AOC
     assert top_3 == 203905
+
+
+# Streaming
+
+
+def test_sample_group_sums_stream(sample_input):
+    sums = list(iter_group_sums(sample_input))
+
+    assert sums == [6000, 4000, 11000, 24000, 10000]
+
+
+def test_sample_stream_top_k(sample_input):
+    top_3 = stream_top_k(sample_input, 3)
+
+    assert top_3 == [24000, 11000, 10000]
+
+
+def test_stream_top_k_with_k_0_is_empty(sample_input):
+    assert stream_top_k(sample_input, 0) == []
+    assert sum_top_k(iter_group_sums(sample_input), 0) == 0
+
+
+def test_stream_top_k_reads_file():
+    with open(f"{INPUTS_PATH}day01a.txt") as f:
+        top_3 = stream_top_k(f, 3)
+
+    assert top_3[0] == 70764
+    assert sum(top_3) == 203905
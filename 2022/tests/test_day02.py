@@ -1,7 +1,10 @@
 import os
 import pytest
 
-from day02 import read_file, score_round, score_rounds, score_rounds_2
+from day02 import (
+    GAME_SCORES_2, count_round_types, read_file, score_buffer, score_file, score_round,
+    score_rounds, score_rounds_2
+)
 
 INPUTS_PATH = os.path.join(os.path.dirname(__file__), "inputs/")
 
@@ -84,3 +87,38 @@ def test_part_2_solution(puzzle_input):
 
     # Accepted part 2 solution
     assert part2_solution == 13433
+
+
+# Bulk scoring
+
+
+def test_score_buffer_matches_score_rounds():
+    data = b"A Y\nB X\r\nC Z\nA Y"
+
+    assert score_buffer(data) == 15 + 8
+    assert score_buffer(data, GAME_SCORES_2) == 12 + 4
+
+
+def test_score_buffer_handles_fixed_width_records():
+    data = b"A Y\nB X\nC Z\nA Y\n"
+
+    assert score_buffer(data) == 15 + 8
+    assert score_buffer(data[:-1]) == 15 + 8
+    assert score_buffer(b"A Y\r\nB X\r\nC Z\r\n") == 15
+
+
+@pytest.mark.parametrize("data", [
+    b"B W\n",  # Wraps onto a valid round index
+    b"A Y\nD X\nC Z\n",
+    b"A Y\nB X\r\nC Q\n",  # Mixed line endings take the line by line path
+    b"A Y\n\nA YZ\n",
+    b"A Y\nC Z\nB W",  # Invalid final line without a newline
+])
+def test_count_round_types_raises_on_invalid_round(data):
+    with pytest.raises(ValueError):
+        count_round_types(data)
+
+
+def test_score_file_solves_both_parts():
+    assert score_file(f"{INPUTS_PATH}day02.txt") == 13484
+    assert score_file(f"{INPUTS_PATH}day02.txt", GAME_SCORES_2) == 13433
@@ -1,7 +1,9 @@
 import pytest
 
 from aoc_utils import parse_input_file
-from day03 import calculate_rucksack_priority, calculate_group_priority
+from day03 import (
+    calculate_rucksack_priority, calculate_group_priority, calculate_total_priorities
+)
 
 
 @pytest.fixture
@@ -98,3 +100,28 @@ def test_part2_solution(puzzle_input):
 
     # Accepted solution
     assert total_priority == 2683
+
+
+# Batch
+
+
+def test_example_total_priorities_in_one_pass(example_input):
+    totals = calculate_total_priorities("\n".join(example_input))
+
+    assert totals == (157, 70)
+
+
+def test_puzzle_total_priorities_in_one_pass(puzzle_input):
+    totals = calculate_total_priorities("\r\n".join(puzzle_input).encode())
+
+    assert totals == (7831, 2683)
+
+
+def test_total_priorities_raises_when_group_has_no_common_items():
+    with pytest.raises(ValueError):
+        calculate_total_priorities('abcd\nefgh\nijkl')
+
+
+def test_total_priorities_raises_on_incomplete_last_group(example_input):
+    with pytest.raises(ValueError):
+        calculate_total_priorities("\n".join(example_input[:5]))
@@ -1,9 +1,13 @@
+import numpy as np
 import pytest
 import re
 from typing import Tuple
 
-from aoc_utils import parse_input_file
-from day04 import range_contains_range, range_overlaps_range
+from aoc_utils import get_input_path, parse_input_file
+from day04 import (
+    IntervalIndex, range_contains_range, range_overlaps_range, range_pairs_from_text,
+    ranges_contain_ranges, ranges_overlap_ranges
+)
 
 
 def parser(line: str) -> Tuple[Tuple[int, int], Tuple[int, int]]:
@@ -114,3 +118,41 @@ def test_part2_solution(puzzle_input):
 
     # Accepted part 2 solution
     assert total_overlapping == 893
+
+
+# Batch queries
+
+
+@pytest.fixture
+def puzzle_range_pairs():
+    with open(get_input_path("day04.txt")) as f:
+        return range_pairs_from_text(f.read())
+
+
+def test_range_masks_solve_both_parts(puzzle_range_pairs):
+    assert puzzle_range_pairs.shape == (1000, 4)
+    assert ranges_contain_ranges(puzzle_range_pairs).sum() == 582
+    assert ranges_overlap_ranges(puzzle_range_pairs).sum() == 893
+
+
+def test_interval_index_overlap_queries():
+    index = IntervalIndex(starts=[2, 6, 5, 20], ends=[4, 8, 7, 25])
+
+    assert index.overlapping(7, 9).tolist() == [1, 2]
+    assert index.count_overlapping(7, 9) == 2
+    assert index.count_overlapping(9, 19) == 0
+    assert index.count_overlapping_pairs() == 1
+    assert index.covered_length() == 3 + 4 + 6
+
+
+def test_interval_index_matches_pairwise_checks(puzzle_range_pairs):
+    ranges = np.concatenate([puzzle_range_pairs[:, :2], puzzle_range_pairs[:, 2:]])
+    index = IntervalIndex(ranges[:, 0], ranges[:, 1])
+
+    for i in range(0, len(ranges), 97):
+        query = tuple(ranges[i])
+        expected = [j for j, other in enumerate(ranges)
+                    if range_overlaps_range(query, tuple(other))]
+
+        assert index.overlapping(*query).tolist() == expected
+        assert index.count_overlapping(*query) == len(expected)
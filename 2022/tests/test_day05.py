@@ -182,3 +182,48 @@ def test_part2_solution(puzzle_input):
 
     # Accepted part 2 solution
     assert top_row == 'BPCZJLFJW'
+
+
+# Streaming moves
+
+
+def test_apply_moves_reads_move_lines(example_input):
+    stacks, _ = example_input
+    crate_mover = CrateMover(stacks)
+    move_lines = ["move 1 from 2 to 1", "move 3 from 1 to 3", "",
+                  "move 2 from 2 to 1", "move 1 from 1 to 2"]
+
+    crate_mover.apply_moves(move_lines)
+
+    assert crate_mover.get_top_row() == 'MCD'
+
+
+def test_apply_moves_from_file_solves_part1(puzzle_input):
+    stacks, _ = puzzle_input
+    crate_ship = CrateShip(stacks)
+
+    with open(f"{INPUTS_PATH}/day05.txt") as f:
+        crate_ship.apply_moves(line for line in f if line.startswith("move"))
+
+    assert crate_ship.get_top_row() == 'QNHWJVJZW'
+
+
+def test_move_to_same_stack_is_unchanged():
+    crate_ship = CrateShip([['A', 'B', 'C']])
+    crate_ship.move_crates(2, 1, 1)
+    crate_mover = CrateMover([['A', 'B', 'C']])
+    crate_mover.move_crates(2, 1, 1)
+
+    assert crate_ship.get_stacks() == crate_mover.get_stacks() == [['A', 'B', 'C']]
+
+
+@pytest.mark.parametrize("ship_class", [CrateShip, CrateMover])
+def test_moving_more_crates_than_stack_holds_raises(ship_class):
+    crate_ship = ship_class([['A'], ['B']])
+
+    with pytest.raises(IndexError):
+        crate_ship.move_crates(3, 1, 2)
+    with pytest.raises(IndexError):
+        crate_ship.apply_moves(["move 2 from 1 to 2"])
+
+    assert crate_ship.get_stacks() == [['A'], ['B']]
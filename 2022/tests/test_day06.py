@@ -1,7 +1,8 @@
+import io
 import pytest
 
-from aoc_utils import parse_input_file
-from day06 import find_packet_start, find_message_start
+from aoc_utils import get_input_path, parse_input_file
+from day06 import find_marker, find_packet_start, find_message_start
 
 
 @pytest.fixture
@@ -116,3 +117,26 @@ def test_part2_solution(puzzle_input):
 
     # Accepted part 2 solution
     assert start == 2564
+
+
+# Streaming
+
+
+def test_marker_found_across_chunk_boundaries():
+    packet = io.BytesIO(b'mjqjpqmgbljsphdztnvjfqwrcgsmlb')
+
+    start = find_marker(packet, marker_len=14, chunk_size=3)
+
+    assert start == 19
+
+
+def test_marker_not_found_returns_minus_1():
+    assert find_packet_start(iter(['aab', 'bab', 'a'])) == -1
+    assert find_packet_start('abc\ndefg') == -1
+
+
+def test_puzzle_input_streams_from_file():
+    with open(get_input_path("day06.txt"), "rb") as f:
+        assert find_packet_start(f) == 1356
+        f.seek(0)
+        assert find_message_start(f) == 2564
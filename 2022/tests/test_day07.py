@@ -1,7 +1,7 @@
 import pytest
 
-from aoc_utils import parse_input_file
-from day07 import FileSystem, build_fs_from_terminal
+from aoc_utils import get_input_path, parse_input_file
+from day07 import FileSystem, build_fs_from_terminal, iter_dir_sizes
 
 
 @pytest.fixture
@@ -165,3 +165,57 @@ def test_part2_solution(puzzle_fs):
 
     # Accepted part 2 solution
     assert delete_size == 8278005
+
+
+def test_fs_touch_rolls_size_up_to_parents(fs):
+    fs.mkdir('a')
+    fs.cd('a')
+    fs.mkdir('b')
+    fs.cd('b')
+    fs.touch('f', 100)
+    fs.cd('..')
+    fs.touch('g', 10)
+
+    assert fs.root.size == 110
+    assert fs.root['a'].size == 110
+    assert fs.root['a']['b'].size == 100
+
+
+def test_get_catalog_handles_very_deep_tree(fs):
+    depth = 5000
+    for i in range(depth):
+        fs.mkdir(f"d{i}")
+        fs.cd(f"d{i}")
+    fs.touch('leaf', 7)
+
+    catalog = fs.get_dir_catalog()
+
+    assert len(catalog) == depth + 1
+    assert all(size == 7 for _, size in catalog)
+
+
+# Streaming
+
+
+def test_build_fs_from_open_file():
+    with open(get_input_path("day07ex.txt")) as f:
+        fs = build_fs_from_terminal(f)
+
+    expected = [('/', 48381165), ('a', 94853), ('e', 584), ('d', 24933642)]
+
+    assert fs.get_dir_catalog() == expected
+
+
+def test_iter_dir_sizes_yields_finished_dirs_first(example_input):
+    dir_sizes = list(iter_dir_sizes(example_input))
+
+    expected = [('e', 584), ('a', 94853), ('d', 24933642), ('/', 48381165)]
+
+    assert dir_sizes == expected
+
+
+def test_iter_dir_sizes_solves_part1_from_file():
+    with open(get_input_path("day07.txt")) as f:
+        solution = sum(size for _, size in iter_dir_sizes(f) if size <= 100000)
+
+    assert solution == 1141028
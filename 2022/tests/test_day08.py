@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from aoc_utils import parse_input_file
@@ -10,6 +11,35 @@ def parse_line(line):
     return [int(i) for i in line.strip()]
 
 
+def brute_force_lines_of_sight(tree_matrix, row, col):
+    """The trees seen looking left, right, up and down from (row, col), nearest first"""
+    tree_row = tree_matrix[row]
+    tree_col = [trees[col] for trees in tree_matrix]
+
+    return [tree_row[:col][::-1], tree_row[col+1:], tree_col[:row][::-1], tree_col[row+1:]]
+
+
+def brute_force_visible(tree_matrix, row, col):
+    height = tree_matrix[row][col]
+    lines = brute_force_lines_of_sight(tree_matrix, row, col)
+
+    return any(all(tree < height for tree in line) for line in lines)
+
+
+def brute_force_scenic_score(tree_matrix, row, col):
+    height = tree_matrix[row][col]
+    score = 1
+    for line in brute_force_lines_of_sight(tree_matrix, row, col):
+        distance = 0
+        for tree in line:
+            distance += 1
+            if tree >= height:
+                break
+        score *= distance
+
+    return score
+
+
 @pytest.fixture
 def example_input():
     return parse_input_file("day08ex.txt", parse_line)
@@ -49,6 +79,21 @@ def test_part1_solution(puzzle_input):
     assert visible_count == 1812
 
 
+@pytest.mark.parametrize("shape", [(1, 1), (1, 7), (6, 1), (9, 13), (20, 20)])
+@pytest.mark.parametrize("max_height", [1, 3, 10])
+def test_kernels_match_brute_force_on_random_grids(shape, max_height):
+    rng = np.random.default_rng(sum(shape) * max_height)
+    tree_matrix = rng.integers(0, max_height, size=shape).tolist()
+    coords = [(row, col) for row in range(shape[0]) for col in range(shape[1])]
+
+    visible_matrix = get_visible_matrix(tree_matrix)
+    scenic_matrix = get_scenic_matrix(tree_matrix)
+
+    for row, col in coords:
+        assert visible_matrix[row, col] == brute_force_visible(tree_matrix, row, col)
+        assert scenic_matrix[row, col] == brute_force_scenic_score(tree_matrix, row, col)
+
+
 # Part 2
 
 
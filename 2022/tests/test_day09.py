@@ -2,7 +2,7 @@ import pytest
 from typing import Tuple
 
 from aoc_utils import parse_input_file
-from day09 import Rope, LongRope
+from day09 import BitmapVisited, LongRope, PackedVisited, Rope
 
 
 def parse_line(line: str) -> Tuple[str, int]:
@@ -214,22 +214,31 @@ def test_example_calculates_expected_p2(example_input):
     assert num_tail_positions == 1
 
 
-@pytest.mark.skip
 def test_example2_calculates_expected(example2_input):
     rope = LongRope()
 
-    for direction, steps in example2_input[:2]:
+    for direction, steps in example2_input:
         rope.move(direction, steps)
-        print(f"Move: {direction} {steps}: {rope.knots}")
-
 
     num_tail_positions = len(rope.tail_visited)
 
-    print(rope.tail_visited)
-
     assert num_tail_positions == 36
 
 
+def test_straight_rope_moves_match_single_steps(example2_input):
+    # Long moves pull the rope straight and take the shortcut
+    batched = LongRope()
+    stepped = LongRope()
+
+    for direction, steps in example2_input:
+        batched.move(direction, steps * 7)
+        for _ in range(steps * 7):
+            stepped.move(direction, 1)
+
+    assert batched.knots == stepped.knots
+    assert batched.tail_visited == stepped.tail_visited
+
+
 @pytest.mark.skip
 def test_part2_solution(puzzle_input):
     rope = LongRope()
@@ -243,3 +252,47 @@ def test_part2_solution(puzzle_input):
 
     # Accepted part 1 solution
     assert num_tail_positions == 6057
+
+
+@pytest.mark.parametrize("visited_store", [PackedVisited, BitmapVisited])
+def test_visited_stores_match_set(visited_store):
+    cells = [(0, 0), (-1, 2), (40, -75), (-300, 7), (-1, 2), (2000, -1500)]
+    visited = visited_store(cells)
+
+    assert len(visited) == len(set(cells))
+    assert all(cell in visited for cell in cells)
+    assert (1, 2) not in visited
+    assert visited == set(cells)
+
+
+@pytest.mark.parametrize("visited_store", [set, PackedVisited, BitmapVisited])
+def test_visited_store_gives_same_tail_count(example2_input, visited_store):
+    rope = LongRope(visited_store=visited_store)
+
+    for direction, steps in example2_input:
+        rope.move(direction, steps)
+
+    assert len(rope.tail_visited) == 36
+
+
+def test_ropes_default_to_packed_visited():
+    # A sparse walk must not pay for a bitmap over its whole bounding box
+    rope = Rope()
+    rope.move('R', 20000)
+    rope.move('U', 20000)
+
+    assert isinstance(rope.tail_visited, PackedVisited)
+    assert isinstance(LongRope().tail_visited, PackedVisited)
+    assert len(rope.tail_visited) == 39999
+
+
+@pytest.mark.parametrize("cell", [(1 << 31, 0), (0, -(1 << 31) - 1)])
+def test_packed_visited_rejects_cells_outside_32_bits(cell):
+    visited = PackedVisited([((1 << 31) - 1, -(1 << 31))])
+
+    with pytest.raises(ValueError):
+        visited.add(cell)
+
+    assert cell not in visited
+
+    assert visited == {((1 << 31) - 1, -(1 << 31))}
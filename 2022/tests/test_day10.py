@@ -43,6 +43,20 @@ def test_sample_program(sample_program):
     assert cpu.register_history == expected_history
 
 
+def test_compiled_sample_program(sample_program):
+    cpu = CrtCpu(compiled=True)
+    cpu.execute_program(sample_program)
+
+    expected_history = [1, 1, 1, 4, 4, -1]
+
+    assert cpu.history_length == len(expected_history)
+    assert cpu.register_at(range(6)).tolist() == expected_history
+    assert cpu.register_history == [1]
+
+    with pytest.raises(IndexError):
+        cpu.register_at(6)
+
+
 def test_example_input_read_correctly(example_input):
     assert type(example_input) is list
     assert len(example_input) == 146
@@ -93,6 +107,13 @@ def test_part1_solution(puzzle_input):
     # Accepted part 1 solution
     assert solution == 13060
 
+
+def test_compiled_part1_solution(puzzle_input):
+    cpu = CrtCpu(compiled=True)
+    cpu.execute_program(puzzle_input)
+
+    assert cpu.get_signal_strength() == 13060
+
 # Part 2
 
 
@@ -125,6 +146,18 @@ def test_sample_input_draws_expected(example_input):
     assert first_row == expected_first_row
 
 
+def test_compiled_display_matches(puzzle_input):
+    cpu = CrtCpu()
+    cpu.execute_program(puzzle_input)
+    cpu.draw_display()
+
+    compiled_cpu = CrtCpu(compiled=True)
+    compiled_cpu.execute_program(puzzle_input)
+    compiled_cpu.draw_display()
+
+    assert compiled_cpu.display == cpu.display
+
+
 def test_part2_solution(puzzle_input):
     cpu = CrtCpu()
     cpu.execute_program(puzzle_input)
@@ -1,4 +1,5 @@
 import pytest
+from itertools import product
 
 from day11 import BarrelOfMonkeys, Monkey
 
@@ -217,10 +218,10 @@ def puzzle2_input(puzzle_input):
 
     return barrel
 
-@pytest.mark.skip
+
 def test_example2_input_calculates_expected_solution(example2_input):
     barrel = example2_input
-    barrel.play(num_rounds=1000)
+    barrel.play(num_rounds=10000)
     inspection_counts = barrel.get_inspection_counts()
 
     most_act1, most_act2 = sorted(inspection_counts, reverse=True)[:2]
@@ -228,7 +229,49 @@ def test_example2_input_calculates_expected_solution(example2_input):
     print(f"Example solution: {solution}")
     print(f"Inspection counts: {inspection_counts}")
 
-    pytest.fail()
-    # expected_solution = 0
+    expected_solution = 2713310158
+
+    assert solution == expected_solution
+
+
+def test_mixed_reduce_levels_match_unreduced_play(example_input):
+    """
+    With only some monkeys dividing by 3, worry levels can't be reduced
+    modulo the LCM, so play() must match exact turn by turn arithmetic
+    """
+    barrel = example_input
+    for monkey, reduce_level in zip(barrel.monkeys, [True, False, True, False]):
+        monkey.reduce_level = reduce_level
+    starting_items = [monkey.items.copy() for monkey in barrel.monkeys]
+
+    for _, monkey in product(range(20), barrel.monkeys):
+        monkey.take_turn()
+    expected_counts = barrel.get_inspection_counts()
+
+    for monkey, items in zip(barrel.monkeys, starting_items):
+        monkey.items = items
+        monkey.inspections = 0
+    barrel.play(num_rounds=20)
+
+    assert expected_counts == [98, 98, 13, 100]
+    assert barrel.get_inspection_counts() == expected_counts
+
+
+def test_play_items_matches_turn_by_turn(puzzle2_input):
+    barrel = puzzle2_input
+    num_rounds = 1000
+    starting_items = [monkey.items.copy() for monkey in barrel.monkeys]
+
+    modulus = barrel.worry_modulus
+    for _, monkey in product(range(num_rounds), barrel.monkeys):
+        monkey.take_turn(modulus=modulus)
+    expected_counts = barrel.get_inspection_counts()
+    expected_items = [sorted(monkey.items) for monkey in barrel.monkeys]
+
+    for monkey, items in zip(barrel.monkeys, starting_items):
+        monkey.items = items
+        monkey.inspections = 0
+    barrel.play_items(num_rounds)
 
-    #assert solution == expected_solution
\ No newline at end of file
+    assert barrel.get_inspection_counts() == expected_counts
+    assert [sorted(monkey.items) for monkey in barrel.monkeys] == expected_items
@@ -1,7 +1,10 @@
 import pytest
 
 from aoc_utils import parse_input_file
-from day12 import shortest_path, find_adjacent_nodes
+from day12 import (
+    shortest_path, find_adjacent_nodes, get_adjacency_masks, get_distance_field,
+    get_elevation_array
+)
 
 
 @pytest.fixture
@@ -33,7 +36,8 @@ def test_example_input_find_adjacent_from_start(example_input):
 def test_example_input_find_adjacent_from_middle(example_input):
     adjacent_nodes = find_adjacent_nodes(example_input, 2, 2)
 
-    expected_adjacent_nodes = [(0, 1), (1, 0)]
+    # (2, 3) is an 's', too high to climb to from a 'c'
+    expected_adjacent_nodes = [(1, 2), (2, 1), (3, 2)]
     print(f"Start at (2, 2) {example_input[2][2]}")
     for r, c in adjacent_nodes:
         print(f"{r},{c}: {example_input[r][c]}")
@@ -41,10 +45,49 @@ def test_example_input_find_adjacent_from_middle(example_input):
     assert adjacent_nodes == expected_adjacent_nodes
 
 
-@pytest.mark.skip
+def test_example_adjacency_masks_match_adjacent_nodes(example_input):
+    masks = get_adjacency_masks(get_elevation_array(example_input))
+    offsets = [(-1, 0), (0, -1), (0, 1), (1, 0)]
+
+    for r in range(len(example_input)):
+        for c in range(len(example_input[0])):
+            from_mask = [(r + dr, c + dc) for bit, (dr, dc) in enumerate(offsets)
+                         if masks[r, c] >> bit & 1]
+
+            assert from_mask == find_adjacent_nodes(example_input, r, c)
+
+
 def test_example_input_calculates_expected_path(example_input):
-    path = shortest_path(example_input)
+    path_len = shortest_path(example_input)
+
+    assert path_len == 31
+
+
+# Part 2
+
+
+def test_example_input_calculates_expected_path_from_any_a(example_input):
+    path_len = shortest_path(example_input, starts='Sa')
+
+    assert path_len == 29
+
+
+def test_example_reverse_search_finds_same_paths(example_input):
+    assert shortest_path(example_input, reverse=True) == 31
+    assert shortest_path(example_input, starts='Sa', reverse=True) == 29
+
+
+def test_example_reverse_search_accepts_row_strings(example_input):
+    rows = ["".join(row) for row in example_input]
+
+    assert shortest_path(rows, reverse=True) == 31
+    assert shortest_path(rows, starts='Sa', reverse=True) == 29
+
 
-    print(path.pq)
+def test_example_reverse_distance_field(example_input):
+    """Reverse distances from S and E agree with the forward search"""
+    forward = get_distance_field(example_input)
+    reverse = get_distance_field(example_input, reverse=True)
 
-    pytest.fail()
+    assert reverse[0, 0] == forward[2, 5] == 31
+    assert reverse[2, 5] == 0
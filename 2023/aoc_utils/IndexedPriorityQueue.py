@@ -0,0 +1,127 @@
+import itertools
+
+
+class IndexedPriorityQueue:
+    """
+    Binary heap priority queue with a position map, so the priority of an
+    item already in the queue can be changed in place in O(log n).
+    Drop-in replacement for PriorityQueue: unlike its lazy deletion, no
+    tombstone entries are left behind, so the heap only ever holds live items.
+    """
+    def __init__(self):
+        self.heap = []  # Entries of [priority, count, item]
+        self.position = {}  # item -> index of its entry in heap
+        self.counter = itertools.count()
+
+    def add(self, item, priority=float("inf")):
+        """Add a item to the queue (replace its priority if it is already there)"""
+        if item in self.position:
+            index = self.position[item]
+            entry = self.heap[index]
+            old_priority = entry[0]
+            entry[0] = priority
+            entry[1] = next(self.counter)
+
+            if priority < old_priority:
+                self._sift_up(index)
+            else:
+                self._sift_down(index)
+        else:
+            self.heap.append([priority, next(self.counter), item])
+            self.position[item] = len(self.heap) - 1
+            self._sift_up(len(self.heap) - 1)
+
+    def remove_item(self, item):
+        """Remove an item from the queue"""
+        index = self.position.pop(item)
+        last = self.heap.pop()
+
+        if index < len(self.heap):
+            # Fill the hole with the last entry and restore the heap from there
+            self.heap[index] = last
+            self.position[last[2]] = index
+            self._sift_up(index)
+            self._sift_down(self.position[last[2]])
+
+    def pop(self):
+        """
+        Remove the item with the lowest priority,
+        returns tuple of (item, priority)
+        """
+        if not self.heap:
+            raise KeyError("Can not pop when queue is empty")
+
+        priority, _, item = self.heap[0]
+        self.remove_item(item)
+
+        return (item, priority)
+
+    def update(self, item, priority):
+        """
+        If specified priority is _higher_ than the item's current priority, no
+            changes are made.
+        If item exists in the queue and the specified priority is _lower_ than
+            its current priority, decrease the item's priority in place.
+        If item is not in queue, add it with the specified priority.
+        """
+        if not self.contains(item) or priority < self[item]:
+            self.add(item, priority)
+
+    def contains(self, item):
+        return item in self.position
+
+    def __getitem__(self, item):
+        """Return the priority of item"""
+        return self.heap[self.position[item]][0]
+
+    def __setitem__(self, item, priority):
+        """Update the item priority only if it already exists"""
+        if item in self.position:
+            self.add(item, priority=priority)
+        else:
+            raise KeyError(item)
+
+    def __len__(self):
+        return len(self.heap)
+
+    def _sift_up(self, index):
+        """Move the entry at index towards the root until its parent is smaller"""
+        heap, position = self.heap, self.position
+        entry = heap[index]
+
+        while index > 0:
+            parent_index = (index - 1) >> 1
+            parent = heap[parent_index]
+            if entry < parent:
+                heap[index] = parent
+                position[parent[2]] = index
+                index = parent_index
+            else:
+                break
+
+        heap[index] = entry
+        position[entry[2]] = index
+
+    def _sift_down(self, index):
+        """Move the entry at index towards the leaves until both children are larger"""
+        heap, position = self.heap, self.position
+        size = len(heap)
+        entry = heap[index]
+
+        while True:
+            child_index = 2 * index + 1
+            if child_index >= size:
+                break
+            # Pick the smaller of the two children
+            if child_index + 1 < size and heap[child_index + 1] < heap[child_index]:
+                child_index += 1
+            child = heap[child_index]
+            if child < entry:
+                heap[index] = child
+                position[child[2]] = index
+                index = child_index
+            else:
+                break
+
+        heap[index] = entry
+        position[entry[2]] = index
@@ -0,0 +1,198 @@
+import hashlib
+import inspect
+import os
+import pickle
+from typing import Any, Callable, Optional
+
+
+class InputCache:
+    """
+    On-disk cache of parsed puzzle inputs.
+    Entries are pickled and keyed by the input file's path, mtime and content
+    hash plus the code of the parse function and the source of the module
+    defining it. Parse functions whose closures can't be hashed reliably are
+    never cached. Edits to other modules the parser reads from (eg a helper
+    or constant imported from a day module) are not seen, and their stale
+    entries keep being returned, which is why caching is opt-in through
+    AOC_CACHE_PATH. Once the cache grows past max_bytes the least recently
+    used entries are evicted.
+    """
+    # Values with a stable repr that can safely stand in for closure contents
+    SIMPLE_TYPES = (str, bytes, int, float, bool, type(None))
+    SUFFIX = ".pickle"
+
+    def __init__(self, cache_path: str, max_bytes: int = 64 * 1024 * 1024):
+        self.cache_path = cache_path
+        self.max_bytes = max_bytes
+        os.makedirs(cache_path, exist_ok=True)
+
+    def fetch(self, path: str, parse_line: Callable, load: Callable[[], Any]) -> Any:
+        """
+        Return the cached result of parsing path with parse_line, calling
+        load() to produce (and then cache) it on a miss
+        """
+        key = self.get_key(path, parse_line)
+        if key is None:
+            return load()
+
+        entry_path = os.path.join(self.cache_path, key + self.SUFFIX)
+
+        try:
+            with open(entry_path, "rb") as f:
+                result = pickle.load(f)
+            # Touch the entry so eviction treats it as recently used
+            os.utime(entry_path)
+            return result
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+
+        result = load()
+        self.store(entry_path, result)
+
+        return result
+
+    def store(self, entry_path: str, result: Any) -> None:
+        """Write result to the cache, then evict entries until under max_bytes"""
+        try:
+            data = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            # Some parsed objects (eg lambdas) can't be pickled; just don't cache them
+            return
+
+        if len(data) > self.max_bytes:
+            return
+
+        # Write to a temp file first so a concurrent reader never sees half an entry
+        tmp_path = f"{entry_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, entry_path)
+
+        self.evict(keep=entry_path)
+
+    def evict(self, keep: str = None) -> None:
+        """
+        Remove least recently used entries until the cache fits in max_bytes,
+        never removing the entry at keep (the one just stored)
+        """
+        entries = []
+        total_bytes = 0
+
+        for entry in os.scandir(self.cache_path):
+            if entry.name.endswith(self.SUFFIX) and entry.path != keep:
+                stat = entry.stat()
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                total_bytes += stat.st_size
+            elif entry.path == keep:
+                total_bytes += entry.stat().st_size
+
+        for _, size, entry_path in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(entry_path)
+            except FileNotFoundError:
+                pass
+            total_bytes -= size
+
+    def clear(self) -> None:
+        """Remove every entry from the cache"""
+        for entry in os.scandir(self.cache_path):
+            if entry.name.endswith(self.SUFFIX):
+                os.remove(entry.path)
+
+    @classmethod
+    def get_key(cls, path: str, parse_line: Callable) -> Optional[str]:
+        """
+        Build the cache key for parsing the file at path with parse_line, or
+        None if parse_line can't be hashed reliably and must not be cached
+        """
+        parser_hash = cls.hash_parser(parse_line)
+        if parser_hash is None:
+            return None
+
+        stat = os.stat(path)
+        key = hashlib.sha256()
+        key.update(os.path.abspath(path).encode())
+        key.update(str(stat.st_mtime_ns).encode())
+        key.update(cls.hash_file(path).encode())
+        key.update(parser_hash.encode())
+
+        return key.hexdigest()
+
+    @staticmethod
+    def hash_file(path: str, chunk_size: int = 1024 * 1024) -> str:
+        """Hash the contents of the file at path without reading it all at once"""
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                digest.update(chunk)
+
+        return digest.hexdigest()
+
+    @classmethod
+    def hash_parser(cls, parse_line: Callable) -> Optional[str]:
+        """
+        Identify a parse function by its name and compiled code rather than
+        its id(), so the same lambda defined on every test run gets the same
+        hash but editing the parser invalidates its entries. The source of
+        the parser's module is hashed too, since editing a helper or global
+        the parser calls changes what it returns. Returns None when a closure
+        or default holds a value whose repr doesn't pin down its behaviour.
+        """
+        digest = hashlib.sha256()
+        digest.update(str(getattr(parse_line, "__module__", "")).encode())
+        digest.update(getattr(parse_line, "__qualname__", repr(parse_line)).encode())
+
+        code = getattr(parse_line, "__code__", None)
+        if code is not None:
+            cls.hash_code(digest, code)
+
+        module_path = cls.get_module_path(parse_line)
+        if module_path is not None:
+            digest.update(cls.hash_file(module_path).encode())
+
+        # Closure values and defaults change what the parser does, eg a
+        # separator bound by a parser factory
+        values = [cell.cell_contents for cell in getattr(parse_line, "__closure__", None) or ()]
+        values.extend(getattr(parse_line, "__defaults__", None) or ())
+        for value in values:
+            if not cls.is_simple_value(value):
+                return None
+            digest.update(repr(value).encode())
+
+        return digest.hexdigest()
+
+    @staticmethod
+    def get_module_path(parse_line: Callable) -> Optional[str]:
+        """Path to the source file of the module defining parse_line, if it has one"""
+        module = inspect.getmodule(parse_line)
+        module_path = getattr(module, "__file__", None)
+        if module_path is None or not os.path.isfile(module_path):
+            return None
+
+        return module_path
+
+    @classmethod
+    def is_simple_value(cls, value: Any) -> bool:
+        """Whether value (or every item of a tuple value) has a stable repr"""
+        if isinstance(value, tuple):
+            return all(cls.is_simple_value(item) for item in value)
+
+        return isinstance(value, cls.SIMPLE_TYPES)
+
+    @staticmethod
+    def hash_code(digest, code) -> None:
+        """
+        Feed a code object into digest. Nested code objects (comprehensions,
+        inner lambdas) are hashed recursively since their repr includes an
+        address that changes between runs.
+        """
+        digest.update(code.co_code)
+        digest.update(repr(code.co_names).encode())
+
+        for const in code.co_consts:
+            if hasattr(const, "co_code"):
+                InputCache.hash_code(digest, const)
+            else:
+                digest.update(repr(const).encode())
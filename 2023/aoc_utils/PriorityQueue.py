@@ -63,7 +63,7 @@ class PriorityQueue:
     def __setitem__(self, item, priority):
         """Update the item priority only if it already exists"""
         if item in self.entry_finder:
-            self.add_item(item, priority=priority)
+            self.add(item, priority=priority)
         else:
             raise KeyError
 
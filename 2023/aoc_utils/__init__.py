@@ -1 +1,2 @@
 from .aoc_utils import *
+from .Grid import Grid
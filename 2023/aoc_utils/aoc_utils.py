@@ -1,26 +1,91 @@
+import math
+import mmap
+import numbers
 import os
-from typing import Any, Callable, List, Tuple
+from functools import lru_cache
+from itertools import product
+from typing import Any, Callable, Iterator, List, Tuple
 
+import numpy as np
 
-def parse_input_file(filename: str,
-                     parse_line: Callable = lambda line: line.strip(),
-                     inputs_path: str = None) -> List[Any]:
+from .BucketQueue import BucketQueue
+from .IndexedPriorityQueue import IndexedPriorityQueue
+from .InputCache import InputCache
+
+# Largest max edge weight for which get_priority_queue() picks a BucketQueue
+BUCKET_QUEUE_MAX_WEIGHT = 100
+
+
+def get_input_path(filename: str, inputs_path: str = None) -> str:
     """
-    Read the given input file into a list, applying the optional
-    parse_fn
+    Resolve the full path to the given input file, falling back to the
+    AOC_INPUTS_PATH environment variable when inputs_path is not given
     """
     inputs_path = inputs_path or os.environ.get("AOC_INPUTS_PATH", None)
     if not inputs_path:
         raise EnvironmentError("AOC_INPUTS_PATH not set in os.environ,"
                                "and inputs_path was not explicitly specified")
-    output = []
 
-    with open(f"{inputs_path}/{filename}") as f:
-        for line in f.readlines():
-            output.append(parse_line(line))
+    return f"{inputs_path}/{filename}"
 
-    return output
 
+def iter_input_file(filename: str,
+                    parse_line: Callable = lambda line: line.strip(),
+                    inputs_path: str = None) -> Iterator[Any]:
+    """
+    Lazily read the given input file one line at a time, yielding the
+    result of the optional parse_line for each line. Only the current
+    line is held in memory.
+    """
+    with open(get_input_path(filename, inputs_path)) as f:
+        for line in f:
+            yield parse_line(line)
+
+
+def iter_input_file_mmap(filename: str,
+                         parse_line: Callable = lambda line: line.strip(),
+                         inputs_path: str = None) -> Iterator[Any]:
+    """
+    Same as iter_input_file(), but memory-maps the input file so pages are
+    loaded (and released) by the OS on demand. Lines are decoded as UTF-8
+    with universal newlines like text mode open(): "\r\n" and a lone "\r"
+    both end a line and are translated to "\n".
+    """
+    with open(get_input_path(filename, inputs_path), "rb") as f:
+        # mmap refuses to map an empty file
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line in iter(mm.readline, b""):
+                if b"\r" in line:
+                    # readline() only splits on "\n", so split off any lines
+                    # ended by a lone "\r" here
+                    *lines, line = line.replace(b"\r\n", b"\n").split(b"\r")
+                    for part in lines:
+                        yield parse_line(part.decode() + "\n")
+                    if not line:
+                        continue
+                yield parse_line(line.decode())
+
+
+def parse_input_file(filename: str,
+                     parse_line: Callable = lambda line: line.strip(),
+                     inputs_path: str = None) -> List[Any]:
+    """
+    Read the given input file into a list, applying the optional
+    parse_fn. When AOC_CACHE_PATH is set in os.environ the parsed list is
+    cached on disk there, so unchanged inputs are only parsed once.
+    """
+    cache_path = os.environ.get("AOC_CACHE_PATH", None)
+    if not cache_path:
+        return list(iter_input_file(filename, parse_line, inputs_path))
+
+    path = get_input_path(filename, inputs_path)
+    cache = InputCache(cache_path)
+
+    return cache.fetch(path, parse_line,
+                       lambda: list(iter_input_file(filename, parse_line, inputs_path)))
 
 
 def read_raw_input_file(filename: str,
@@ -28,31 +93,90 @@ def read_raw_input_file(filename: str,
     """
     Read the given input file into a single string
     """
-    inputs_path = inputs_path or os.environ.get("AOC_INPUTS_PATH", None)
-    if not inputs_path:
-        raise EnvironmentError("AOC_INPUTS_PATH not set in os.environ,"
-                               "and inputs_path was not explicitly specified")
-
-    with open(f"{inputs_path}/{filename}") as f:
+    with open(get_input_path(filename, inputs_path)) as f:
         output = f.read()
 
     return output
 
 
+@lru_cache(maxsize=None)
+def get_neighbor_offsets(ndim: int = 2, connectivity: int = 8) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Offsets to the neighbors of a point in ndim dimensions, in row-major order.
+    connectivity is 2 * ndim for orthogonal neighbors only (4 in 2D, 6 in 3D)
+    or 3 ** ndim - 1 to include diagonals (8 in 2D, 26 in 3D).
+    """
+    offsets = [offset for offset in product((-1, 0, 1), repeat=ndim) if any(offset)]
+    if connectivity == 2 * ndim:
+        offsets = [offset for offset in offsets if sum(map(abs, offset)) == 1]
+    elif connectivity != len(offsets):
+        raise ValueError(f"Connectivity {connectivity} is not possible in {ndim} dimensions")
+
+    return tuple(offsets)
+
+
+# Neighbor tables hold an entry per cell, so only keep a few grid shapes around
+NEIGHBOR_TABLE_CACHE_SIZE = 4
+
+
+@lru_cache(maxsize=NEIGHBOR_TABLE_CACHE_SIZE)
+def get_neighbor_table(shape: Tuple[int, ...], connectivity: int = 8) -> np.ndarray:
+    """
+    For a grid of the given shape, returns a read-only (cells x neighbors)
+    array where row i holds the flat indexes of the neighbors of flat index i,
+    in get_neighbor_offsets() order, or -1 where a neighbor is off the grid.
+    Built once per shape and connectivity, for the last few shapes used.
+    """
+    offsets = np.array(get_neighbor_offsets(len(shape), connectivity))
+    points = np.indices(shape).reshape(len(shape), -1).T
+    neighbors = points[:, np.newaxis, :] + offsets  # cells x neighbors x ndim
+
+    on_grid = ((neighbors >= 0) & (neighbors < shape)).all(axis=2)
+    table = np.ravel_multi_index(tuple(np.moveaxis(neighbors, 2, 0)), shape, mode='clip')
+    table[~on_grid] = -1
+    table.setflags(write=False)
+
+    return table
+
+
+@lru_cache(maxsize=NEIGHBOR_TABLE_CACHE_SIZE)
+def get_neighbor_indexes(shape: Tuple[int, ...],
+                         connectivity: int = 8) -> Tuple[Tuple[int, ...], ...]:
+    """
+    get_neighbor_table() as a tuple of tuples of flat indexes, with the
+    off-grid neighbors left out, for loops that index one cell at a time
+    """
+    table = get_neighbor_table(shape, connectivity)
+
+    return tuple(tuple(i for i in row if i >= 0) for row in table.tolist())
+
+
 def get_adjacent_points(row: int, col: int, num_rows: int, num_cols: int) -> List[Tuple[int, int]]:
     """Given a point (r, c), return a list of up to 8 adjacent points based on a
         2D array of size num_rows x num_cols, filtering out indices that would be
         out-of-bounds. (Recall that my_list[-1] is a *valid* index in Python)
     """
-    possible_points = [ (row-1, col-1), (row-1, col), (row-1, col+1),
-                        (row, col-1), (row, col+1),
-                        (row+1, col-1), (row+1, col), (row+1, col+1)
-                        ]
-    
     adjacent_points = []
 
-    for point in possible_points:
+    for (row_offset, col_offset) in get_neighbor_offsets(2, 8):
+        point = (row + row_offset, col + col_offset)
         if min(point) >= 0 and point[0] < num_rows and point[1] < num_cols:
             adjacent_points.append(point)
-    
+
     return adjacent_points
+
+
+def get_priority_queue(max_edge_weight: int = None):
+    """
+    Pick the fastest priority queue for a shortest path search: a BucketQueue
+    (Dial's algorithm) when every edge weight is a known small integer,
+    otherwise an IndexedPriorityQueue
+    """
+    # int() can't convert inf or nan, so rule out non-finite weights first
+    if (isinstance(max_edge_weight, numbers.Real)
+            and math.isfinite(max_edge_weight)
+            and max_edge_weight == int(max_edge_weight)
+            and 0 <= max_edge_weight <= BUCKET_QUEUE_MAX_WEIGHT):
+        return BucketQueue()
+
+    return IndexedPriorityQueue()
@@ -1,4 +1,7 @@
-from typing import List, Tuple
+from collections import deque
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
 # from typing_extensions import Self
 
 # Advent of Code Day 1 solution code
@@ -37,15 +40,76 @@ def calibrate_document(document: List[str]) -> int:
 
     return calibration_total
 
+
+def calibrate_buffer(data: bytes) -> int:
+    """
+    calibrate_document() for a whole document in one bytes buffer, without
+    splitting it into lines. The first and last digit of each line are found
+    by binary searching the line boundaries in the array of digit offsets.
+    Blank lines are skipped.
+    """
+    codes = np.frombuffer(data, dtype=np.uint8)
+    digit_offsets = np.flatnonzero((codes - ord('0')) < 10)  # uint8 wraps below '0'
+
+    line_ends = np.flatnonzero(codes == ord('\n'))
+    if len(codes) and codes[-1] != ord('\n'):
+        line_ends = np.append(line_ends, len(codes))
+    line_starts = np.concatenate(([0], line_ends + 1))[:len(line_ends)]
+
+    first = np.searchsorted(digit_offsets, line_starts)
+    last = np.searchsorted(digit_offsets, line_ends) - 1
+    has_digits = first <= last
+
+    if not has_digits.all():
+        # Only lines that are empty once any \r is dropped may lack digits
+        line_lengths = line_ends - line_starts
+        ends_with_cr = codes[np.maximum(line_ends - 1, 0)] == ord('\r')
+        blank = (line_lengths == 0) | ((line_lengths == 1) & ends_with_cr)
+        if not (has_digits | blank).all():
+            raise ValueError("Line contains no digits")
+        first, last = first[has_digits], last[has_digits]
+
+    tens = codes[digit_offsets[first]].astype(np.int64) - ord('0')
+    ones = codes[digit_offsets[last]].astype(np.int64) - ord('0')
+
+    return int(10 * tens.sum() + ones.sum())
+
+
+def calibrate_file(f: BinaryIO, chunk_size: int = 1 << 20) -> int:
+    """
+    Runs calibrate_buffer() over a file opened in binary mode, chunk_size
+    bytes at a time, so memory use doesn't grow with the document.
+    Each chunk is cut after its last newline and the rest carried over.
+    """
+    calibration_total = 0
+    carry = b''
+
+    for chunk in iter(lambda: f.read(chunk_size), b''):
+        chunk = carry + chunk
+        cut = chunk.rfind(b'\n') + 1
+        calibration_total += calibrate_buffer(chunk[:cut])
+        carry = chunk[cut:]
+
+    return calibration_total + calibrate_buffer(carry)
+
 # Part 2
 
 
 class Trie:
+    """
+    Trie of words that doubles as an Aho-Corasick automaton: failure links
+    let a scan find every match, overlapping or not, in one left-to-right
+    pass over the search string.
+    """
 
     class Node:
         def __init__(self) -> None:
             self.children = {}
             self.matching_word = None
+            # Longest proper suffix of this node's path that is also in the trie
+            self.fail = None
+            # Nearest node along the failure links with a matching word
+            self.output = None
 
         def get_child(self, key: str):
             if key not in self.children:
@@ -55,22 +119,61 @@ class Trie:
 
     def __init__(self) -> None:
         self.root = self.Node()
+        self.max_len = 0
+        self.built = False
+        self.reverse_trie = None
 
     def insert(self, word: str) -> None:
         """Insert a word to the trie"""
         if len(word) == 0:
             return
 
-        self._insert(self.root, word, 0)
-
-    def _insert(self, node: Node, word: str, index: int) -> None:
-        """Recursive insert"""
-        child = node.get_child(word[index])
-
-        if index == len(word) - 1:
-            child.matching_word = word
-        else:
-            self._insert(child, word, index + 1)
+        node = self.root
+        for char in word:
+            node = node.get_child(char)
+        node.matching_word = word
+
+        self.max_len = max(self.max_len, len(word))
+        self.built = False
+        self.reverse_trie = None
+
+    def build(self) -> None:
+        """
+        Sets the failure and output links breadth first, so every node's
+        failure target (which is shallower) is already linked
+        """
+        self.root.fail = self.root
+        queue = deque()
+
+        for child in self.root.children.values():
+            child.fail = self.root
+            child.output = None
+            queue.append(child)
+
+        while queue:
+            node = queue.popleft()
+            for key, child in node.children.items():
+                fail = node.fail
+                while fail is not self.root and key not in fail.children:
+                    fail = fail.fail
+                child.fail = fail.children.get(key, self.root)
+                child.output = child.fail if child.fail.matching_word else child.fail.output
+                queue.append(child)
+
+        self.built = True
+
+    def reversed(self):
+        """Returns a trie of every word in this trie spelled backwards"""
+        reverse_trie = self.__class__()
+        stack = [self.root]
+
+        while stack:
+            node = stack.pop()
+            if node.matching_word:
+                reverse_trie.insert(node.matching_word[::-1])
+            stack.extend(node.children.values())
+
+        return reverse_trie
 
     def print(self) -> None:
         self._print(self.root)
@@ -85,32 +188,94 @@ class Trie:
             print(display_str)
             self._print(child_node, display_str)
 
-    def search(self, search_string: str) -> Tuple[str, str]:
-        """Scans the search string recursively for a match"""
-        return self._search(self.root, search_string, 0)
-
-    def _search(self, node: Node, search_string: str, index: int) -> str:
-        """Recursive search"""
-        if index < len(search_string) and search_string[index] in node.children:
-            child_node = node.children[search_string[index]]
-            child_result = self._search(child_node, search_string, index + 1)
-            # Return the child result if there is one, otherwise this node (may be None)
-            return child_result or node.matching_word
-        else:
-            return node.matching_word
+    def search(self, search_string: str) -> Optional[str]:
+        """Returns the longest word the search string starts with, or None"""
+        node = self.root
+        result = None
+
+        for char in search_string:
+            if char not in node.children:
+                break
+            node = node.children[char]
+            result = node.matching_word or result
+
+        return result
+
+    def find_matches(self, search_string: Iterable[str]) -> Iterator[Tuple[int, str]]:
+        """
+        Scans search_string once, yielding (start index, word) for every
+        match as soon as its last character is read, so matches come in
+        order of where they end
+        """
+        if not self.built:
+            self.build()
+
+        root = self.root
+        node = root
+
+        for i, char in enumerate(search_string):
+            while node is not root and char not in node.children:
+                node = node.fail
+            node = node.children.get(char, root)
+
+            match = node if node.matching_word else node.output
+            while match is not None:
+                yield (i - len(match.matching_word) + 1, match.matching_word)
+                match = match.output
 
     def find_all(self, search_string: str) -> List[str]:
-        """Find all matches inside search_string"""
-        results = []
-        i = 0
+        """Find the longest match starting at each index of search_string, in order"""
+        longest = {}
+
+        for start, word in self.find_matches(search_string):
+            if len(word) > len(longest.get(start, "")):
+                longest[start] = word
+
+        return [longest[start] for start in sorted(longest)]
+
+    def first_match(self, search_string: Iterable[str]) -> Optional[str]:
+        """
+        Returns the first word find_all() would, ie the longest match starting
+        furthest left, or None. The scan stops as soon as no match starting
+        any earlier can still end, so only the start of the string is read.
+        """
+        if not self.built:
+            self.build()
+
+        root = self.root
+        node = root
+        best_start, best_word = None, None
+
+        for i, char in enumerate(search_string):
+            if best_start is not None and i >= best_start + self.max_len:
+                break
+
+            while node is not root and char not in node.children:
+                node = node.fail
+            node = node.children.get(char, root)
+
+            match = node if node.matching_word else node.output
+            while match is not None:
+                word = match.matching_word
+                start = i - len(word) + 1
+                if best_start is None or start < best_start or \
+                        (start == best_start and len(word) > len(best_word)):
+                    best_start, best_word = start, word
+                match = match.output
+
+        return best_word
+
+    def last_match(self, search_string: str) -> Optional[str]:
+        """
+        Returns the longest match ending furthest right, or None. Scans
+        backwards from the end of the string with a trie of reversed words.
+        """
+        if self.reverse_trie is None:
+            self.reverse_trie = self.reversed()
 
-        while i < len(search_string):
-            result = self.search(search_string[i:])
-            if result:
-                results.append(result)
-            i = i + 1
+        match = self.reverse_trie.first_match(reversed(search_string))
 
-        return results
+        return match[::-1] if match else None
 
 
 def scan_document(document: List[str]) -> List[int]:
@@ -124,8 +289,9 @@ def scan_document(document: List[str]) -> List[int]:
         trie.insert(digit)
 
     for line in document:
-        line_results = trie.find_all(line)
-        left, right = line_results[0], line_results[-1]
+        left, right = trie.first_match(line), trie.last_match(line)
+        if left is None:
+            raise ValueError("Line contains no digits")
 
         # Replace words with digits where applicable
         left = WORDS_DIGITS.get(left, left)
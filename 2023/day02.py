@@ -1,7 +1,12 @@
-from typing import Tuple
+from array import array
+from typing import Iterable, List, Tuple
+
+import numpy as np
 
 # Advent of Code Day 2 solution code
 
+COLOR_COLUMNS = {"red": 0, "green": 1, "blue": 2}
+
 
 def is_game_possible(game: dict, constraint: Tuple[int, int, int]) -> bool:
     """Checks if game is possible given constraint of number of cubes
@@ -27,3 +32,69 @@ def fewest_cubes_possible(game: dict) -> Tuple[int, int, int]:
     fewest_cubes = (max(reds), max(greens), max(blues))
 
     return fewest_cubes
+
+
+class GameLog:
+    """
+    Every draw of every game stored as NumPy columns: game_ids, draw_idxs
+    and cubes, an N x 3 array of (red, green, blue) counts, in input order.
+    The per-game maximums are worked out once with np.maximum.reduceat,
+    after which any constraint can be checked without re-parsing.
+    """
+
+    def __init__(self, game_ids: np.ndarray, draw_idxs: np.ndarray, cubes: np.ndarray) -> None:
+        self.game_ids = game_ids
+        self.draw_idxs = draw_idxs
+        self.cubes = cubes
+
+        # Each game's rows start where its draw index goes back to 0
+        self.game_starts = np.flatnonzero(draw_idxs == 0)
+        self.ids = game_ids[self.game_starts]
+        self.max_cubes = np.maximum.reduceat(cubes, self.game_starts, axis=0) \
+            if len(cubes) else np.zeros((0, 3), dtype=cubes.dtype)
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str]):
+        """
+        Parses lines like "Game 1: 3 blue, 4 red; 1 red, 2 green, 6 blue"
+        token by token in a single pass, without regexes
+        """
+        game_ids, draw_idxs, cubes = array('i'), array('i'), array('i')
+
+        for line in lines:
+            game_str, _, draws_str = line.partition(":")
+            if not draws_str:
+                continue
+            game_id = int(game_str.split()[1])
+
+            tokens = draws_str.split()
+            draw = [0, 0, 0]
+            draw_idx = 0
+            for count, color in zip(tokens[::2], tokens[1::2]):
+                draw[COLOR_COLUMNS[color.rstrip(",;")]] = int(count)
+                # A draw ends at a ';' or at the end of the line
+                if not color.endswith(","):
+                    game_ids.append(game_id)
+                    draw_idxs.append(draw_idx)
+                    cubes.extend(draw)
+                    draw = [0, 0, 0]
+                    draw_idx += 1
+
+        return cls(np.array(game_ids), np.array(draw_idxs),
+                   np.array(cubes).reshape(-1, 3))
+
+    @classmethod
+    def from_text(cls, text: str):
+        return cls.from_lines(text.splitlines())
+
+    def possible_games(self, constraint: Tuple[int, int, int]) -> np.ndarray:
+        """IDs of the games possible with (red, green, blue) cubes, as in is_game_possible()"""
+        return self.ids[(self.max_cubes <= np.asarray(constraint)).all(axis=1)]
+
+    def fewest_cubes(self) -> List[Tuple[int, int, int]]:
+        """fewest_cubes_possible() of every game"""
+        return [tuple(row) for row in self.max_cubes.tolist()]
+
+    def powers(self) -> np.ndarray:
+        """Power (product of the fewest red, green and blue cubes) of every game"""
+        return self.max_cubes.astype(np.int64).prod(axis=1)
@@ -1,6 +1,7 @@
-from aoc_utils import get_adjacent_points
-from itertools import product
-from typing import List
+from aoc_utils import Grid
+from typing import List, Set, Tuple
+
+import numpy as np
 
 # Advent of Code Day 3 solution code
 
@@ -9,62 +10,58 @@ class Schematic:
     def __init__(self, input_text: List[str]) -> None:
         self.ROWS = len(input_text)
         self.COLS = len(input_text[0])
-        self.valid_partnums = []
-        self.gear_pairs = []
 
-        # Every part num found and a set of points it occupies
-        self.partnum_coords = []
+        chars = Grid.from_lines(input_text).array
+        is_digit = (chars - ord("0")) < 10  # uint8 wraps below '0'
+
+        # Each part num is a run of digits in a row: find where runs start and end
+        left_is_digit = np.zeros_like(is_digit)
+        left_is_digit[:, 1:] = is_digit[:, :-1]
+        right_is_digit = np.zeros_like(is_digit)
+        right_is_digit[:, :-1] = is_digit[:, 1:]
+        run_starts = np.flatnonzero(is_digit & ~left_is_digit)
+        run_ends = np.flatnonzero(is_digit & ~right_is_digit)
+
+        # Label grid: index of the part num occupying each cell, or -1
+        self.labels = np.cumsum(is_digit & ~left_is_digit, dtype=np.int32).reshape(chars.shape) - 1
+        self.labels[~is_digit] = -1
+
+        # (row, first col, last col + 1) of every part num found, in reading order
+        self.partnum_spans = [(start // self.COLS, start % self.COLS, end % self.COLS + 1)
+                              for start, end in zip(run_starts.tolist(), run_ends.tolist())]
+        self.partnums = np.array([int(input_text[r][start:end])
+                                  for r, start, end in self.partnum_spans], dtype=np.int64)
 
-        # A set of every point adjacent to a symbol
-        self.symbol_adjacent_coords = set()
+        # Every point that is a symbol or adjacent to one
+        is_symbol = ~is_digit & (chars != ord("."))
+        self.symbol_adjacent = is_symbol.copy()
+        for view in Grid(is_symbol).neighbor_views(connectivity=8, fill=False):
+            self.symbol_adjacent |= view
+
+        # A partnum is valid if any of its cells is symbol-adjacent
+        valid_labels = np.unique(self.labels[self.symbol_adjacent & is_digit])
+        self.valid_partnums = self.partnums[valid_labels].tolist()
 
         # A set of every (r,c) where a gear ("*") is found
-        self.gear_coords = set()
-
-        for r in range(self.ROWS):
-            current_partnum = ""
-            current_partnum_coords = set()
-
-            for c in range(self.COLS):
-                char = input_text[r][c]
-                if char in "0123456789":
-                    current_partnum = current_partnum + char
-                    current_partnum_coords.add((r, c))
-                else:
-                    if current_partnum:
-                        # At a '.' or symbol add the current partnum if it we're done reading one
-                        self.partnum_coords.append((int(current_partnum), current_partnum_coords))
-                        current_partnum = ""
-                        current_partnum_coords = set()
-                    if char != ".":
-                        # Handle a symbol
-                        adjacent_points = get_adjacent_points(r, c, self.ROWS, self.COLS)
-                        self.symbol_adjacent_coords.update(adjacent_points)
-
-                        if char == "*":
-                            self.gear_coords.add((r, c))
-
-
-            if current_partnum:
-                # At end of a row, add the current partnum if there is one
-                self.partnum_coords.append((int(current_partnum), current_partnum_coords))
-
-        # A partnum is valid if there is any intersection between any of the partnum's
-        # (r,c) coordinates and the set of symbol-adjacent coordinates
-        for (partnum, coords) in self.partnum_coords:
-            if len(self.symbol_adjacent_coords.intersection(coords)) > 0:
-                self.valid_partnums.append(partnum)
-        
-        # Find all gear pairs where a gear is adjacent to exactly 2 partnums
-        for (r, c) in self.gear_coords:
-            adjacent_partnums = []
-            gear_adjacent = set(get_adjacent_points(r, c, self.ROWS, self.COLS))
-            for (partnum, coords) in self.partnum_coords:
-                if len(gear_adjacent.intersection(coords)) > 0:
-                    adjacent_partnums.append(partnum)
-            
-            if len(adjacent_partnums) == 2:
-                self.gear_pairs.append((adjacent_partnums[0], adjacent_partnums[1]))
+        gear_rows, gear_cols = np.nonzero(chars == ord("*"))
+        self.gear_coords = set(zip(gear_rows.tolist(), gear_cols.tolist()))
+
+        # Find all gear pairs where a gear is adjacent to exactly 2 partnums,
+        # reading the labels around every gear at once
+        neighbor_labels = np.stack([view[gear_rows, gear_cols] for view
+                                    in Grid(self.labels).neighbor_views(connectivity=8, fill=-1)],
+                                   axis=1)
+        self.gear_pairs = []
+        for gear_labels in neighbor_labels.tolist():
+            adjacent_labels = sorted(set(gear_labels) - {-1})
+            if len(adjacent_labels) == 2:
+                self.gear_pairs.append(tuple(self.partnums[adjacent_labels].tolist()))
+
+    @property
+    def partnum_coords(self) -> List[Tuple[int, Set[Tuple[int, int]]]]:
+        """Every part num found and a set of points it occupies"""
+        return [(partnum, {(r, c) for c in range(start, end)})
+                for partnum, (r, start, end) in zip(self.partnums.tolist(), self.partnum_spans)]
 
     def calculate_gear_ratio_sum(self):
         gear_ratio_sum = 0
@@ -2,4 +2,4 @@ import os
 
 # This global contains the path to the puzzle inputs files
 path = os.path.join(os.path.dirname(__file__), 'inputs')
-os.environ['AOC_INPUTS_PATH'] = path
\ No newline at end of file
+os.environ['AOC_INPUTS_PATH'] = path
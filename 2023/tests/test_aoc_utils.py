@@ -0,0 +1,30 @@
+import pytest
+
+from aoc_utils import iter_input_file, iter_input_file_mmap
+
+
+def keep_line(line: str):
+    return line
+
+
+def test_iter_input_file_mmap_matches_iter_input_file():
+    expected = list(iter_input_file("day01ex.txt", keep_line))
+    actual = list(iter_input_file_mmap("day01ex.txt", keep_line))
+
+    assert actual == expected
+    assert actual[0] == "1abc2\n"
+
+
+@pytest.mark.parametrize("data", [
+    b"",
+    b"a\nb\r\nc",
+    b"a\rb\r\rc\r\nd\r",
+    b"\r\r\n\n\xc3\xa9\r",
+])
+def test_iter_input_file_mmap_translates_universal_newlines(tmp_path, data):
+    (tmp_path / "newlines.txt").write_bytes(data)
+
+    expected = list(iter_input_file("newlines.txt", keep_line, str(tmp_path)))
+    actual = list(iter_input_file_mmap("newlines.txt", keep_line, str(tmp_path)))
+
+    assert actual == expected
@@ -1,7 +1,8 @@
 import pytest
 
-from aoc_utils import parse_input_file
-from day01 import calibrate_line, calibrate_document, Trie, scan_document
+from aoc_utils import get_input_path, parse_input_file
+from day01 import (calibrate_line, calibrate_document, calibrate_buffer,
+                   calibrate_file, Trie, scan_document)
 
 
 @pytest.fixture
@@ -73,6 +74,24 @@ def test_problem_input(problem_input):
     assert part1_solution == expected_solution
 
 
+def test_calibrate_buffer_matches_document(example_input):
+    document = "\r\n".join(example_input)
+
+    assert calibrate_buffer(document.encode()) == 142
+    assert calibrate_buffer(b"1abc2\n\n\r\ntreb7uchet\n") == 12 + 77
+    assert calibrate_buffer(b"") == 0
+
+    with pytest.raises(ValueError):
+        calibrate_buffer(b"1abc2\nnodigits\n")
+
+
+def test_calibrate_file_problem_input():
+    with open(get_input_path("day01.txt"), "rb") as f:
+        part1_solution = calibrate_file(f, chunk_size=4096)
+
+    assert part1_solution == 54634
+
+
 # Part 2
 @pytest.fixture
 def ex2_input():
@@ -120,6 +139,30 @@ def test_trie_find_all():
     assert results == expected_results
 
 
+def test_trie_find_matches_reports_overlapping_matches():
+    trie = Trie()
+    for word in ["one", "eight", "two", "ne"]:
+        trie.insert(word)
+
+    results = list(trie.find_matches("oneightwo"))
+
+    expected_results = [(0, "one"), (1, "ne"), (2, "eight"), (6, "two")]
+
+    assert results == expected_results
+
+
+def test_trie_first_and_last_match():
+    trie = Trie()
+    for word in ["one", "eight", "two", "1"]:
+        trie.insert(word)
+
+    assert trie.first_match("xoneightwo1x") == "one"
+    assert trie.last_match("xoneightwo1x") == "1"
+    assert trie.last_match("xoneightwox") == "two"
+    assert trie.first_match("nothing") is None
+    assert trie.last_match("nothing") is None
+
+
 def test_scan_document_handles_examples(ex2_input):
     ex_results = scan_document(ex2_input)
     ex_sum = sum(ex_results)
@@ -143,6 +186,11 @@ def test_scan_document_handles_edge_case():
     assert result == expected_result
 
 
+def test_scan_document_raises_on_line_without_digits():
+    with pytest.raises(ValueError):
+        scan_document(["two1nine", "abcdefgh"])
+
+
 def test_part2_input(problem_input):
     part2_result = scan_document(problem_input)
     part2_solution = sum(part2_result)
@@ -1,7 +1,7 @@
 import pytest
 
-from aoc_utils import parse_input_file
-from day02 import is_game_possible, fewest_cubes_possible
+from aoc_utils import parse_input_file, read_raw_input_file
+from day02 import is_game_possible, fewest_cubes_possible, GameLog
 from math import prod
 
 def game_parser(line: str) -> dict:
@@ -85,6 +85,33 @@ def test_part1_solution(problem_input):
 
     assert sum(possible_ids) == expected_sum
 
+
+@pytest.fixture
+def ex1_log():
+    return GameLog.from_text(read_raw_input_file("day02ex.txt"))
+
+
+@pytest.fixture
+def problem_log():
+    return GameLog.from_text(read_raw_input_file("day02.txt"))
+
+
+def test_game_log_columns(ex1_log, ex1_input):
+    num_draws = sum(len(game["game_results"]) for game in ex1_input)
+
+    assert len(ex1_log.game_ids) == len(ex1_log.draw_idxs) == num_draws
+    assert ex1_log.ids.tolist() == [1, 2, 3, 4, 5]
+    assert ex1_log.draw_idxs[:4].tolist() == [0, 1, 2, 0]
+    assert ex1_log.cubes[0].tolist() == [4, 0, 3]
+
+
+def test_game_log_constraints(ex1_log, problem_log):
+    assert ex1_log.possible_games((12, 13, 14)).tolist() == [1, 2, 5]
+    assert problem_log.possible_games((12, 13, 14)).sum() == 2776
+    # The same columns answer any other constraint
+    assert ex1_log.possible_games((20, 13, 15)).tolist() == [1, 2, 3, 4, 5]
+    assert ex1_log.possible_games((0, 0, 0)).tolist() == []
+
 # Part 2
 
 
@@ -110,4 +137,10 @@ def test_p2_solution(problem_input):
     accepted_solution = 68638
     print("Part 2 Solution:", solution)
 
-    assert solution == accepted_solution
\ No newline at end of file
+    assert solution == accepted_solution
+
+
+def test_game_log_powers(ex1_log, ex1_input, problem_log):
+    assert ex1_log.fewest_cubes() == [fewest_cubes_possible(game) for game in ex1_input]
+    assert ex1_log.powers().sum() == 2286
+    assert problem_log.powers().sum() == 68638
\ No newline at end of file
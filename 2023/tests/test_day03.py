@@ -1,6 +1,7 @@
 import pytest
 
-from aoc_utils import parse_input_file, get_adjacent_points
+from aoc_utils import (parse_input_file, get_adjacent_points, get_neighbor_indexes,
+                       get_neighbor_table)
 from day03 import Schematic
 
 @pytest.fixture
@@ -60,6 +61,31 @@ def test_get_adjacent_points_returns_3_points_lower_right_corner():
     assert adjacent_points == expected_points
 
 
+def test_get_adjacent_points_filters_point_outside_grid():
+    adjacent_points = get_adjacent_points(row=3, col=0, num_rows=3, num_cols=3)
+
+    assert adjacent_points == [(2, 0), (2, 1)]
+
+
+def test_get_neighbor_indexes_4_connectivity():
+    # Flat indexes of a 2x3 grid: 0 1 2 / 3 4 5
+    neighbor_indexes = get_neighbor_indexes((2, 3), connectivity=4)
+
+    assert neighbor_indexes[0] == (1, 3)
+    assert neighbor_indexes[4] == (1, 3, 5)
+    # Cached: the same table is handed back
+    assert get_neighbor_indexes((2, 3), connectivity=4) is neighbor_indexes
+
+
+def test_get_neighbor_table_26_connectivity():
+    table = get_neighbor_table((3, 3, 3), connectivity=26)
+
+    assert table.shape == (27, 26)
+    assert (table[13] >= 0).sum() == 26  # Center cube touches every other one
+    assert (table[0] >= 0).sum() == 7  # A corner touches 7
+    assert not table.flags.writeable
+
+
 def test_ex1_reads_expected_partnums(ex1_input):
     schematic = Schematic(ex1_input)
     partnums = [partnum for (partnum, _) in schematic.partnum_coords]